@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+from sqlalchemy import Column, Float, Integer, String
+from sqlalchemy.orm import declarative_base
+
+from src.data.cleaning import sanitize_column_name
+
+
+def generate_frame(
+    rows: int,
+    columns: int,
+    string_ratio: float = 0.3,
+    na_ratio: float = 0.0,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    Build a synthetic raw frame resembling an untouched extract.
+
+    Column names are camel case so ``sanitize_column_name`` has work to do,
+    and string values carry surrounding whitespace for ``strip_strings``.
+
+    :param rows: Number of rows
+    :param columns: Number of columns
+    :param string_ratio: Fraction of columns holding strings (rest are floats)
+    :param na_ratio: Fraction of cells replaced with missing values
+    :param seed: Random seed, so runs are comparable with their baseline
+    :return: Generated DataFrame
+    """
+    rng = np.random.default_rng(seed)
+    n_strings = round(columns * string_ratio)
+    vocabulary = np.array([f" token{i} " for i in range(1_000)], dtype=object)
+
+    data = {}
+    for i in range(columns):
+        if i < n_strings:
+            values = vocabulary[rng.integers(0, len(vocabulary), rows)]
+            name = f"labelCol{i}"
+        else:
+            values = rng.standard_normal(rows)
+            name = f"valueCol{i}"
+        if na_ratio:
+            values = values.astype(object) if i < n_strings else values.copy()
+            values[rng.random(rows) < na_ratio] = None if i < n_strings else np.nan
+        data[name] = values
+    return pd.DataFrame(data)
+
+
+def generate_column_names(count: int, seed: int = 0) -> list:
+    """Generate messy column names for ``sanitize_column_name`` benchmarks."""
+    rng = np.random.default_rng(seed)
+    parts = ["Order", "customer", "Unit Price", "ship-date", "Region.Code", "qty/box"]
+    picks = rng.integers(0, len(parts), (count, 3))
+    return [" " + "".join(parts[j] for j in row) + f" {i} " for i, row in enumerate(picks)]
+
+
+def model_for(df: pd.DataFrame, table_name: str = "benchmark_rows"):
+    """Build a throwaway ORM model matching the sanitized columns of a frame."""
+    Base = declarative_base()
+    attrs = {"__tablename__": table_name, "id": Column(Integer, primary_key=True)}
+    for name, dtype in df.dtypes.items():
+        column = sanitize_column_name(name)
+        attrs[column] = Column(Float if dtype.kind == "f" else String(64))
+    return type("BenchmarkRow", (Base,), attrs)
@@ -0,0 +1,118 @@
+import json
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing and memory summary for one benchmark case."""
+
+    name: str
+    items: int
+    repeat: int
+    p50_s: float
+    p95_s: float
+    p99_s: float
+    throughput: float
+    peak_mb: float
+
+    def format(self) -> str:
+        return (
+            f"{self.name:<28} p50={self.p50_s * 1e3:9.2f}ms "
+            f"p95={self.p95_s * 1e3:9.2f}ms p99={self.p99_s * 1e3:9.2f}ms "
+            f"{self.throughput:12,.0f} items/s peak={self.peak_mb:8.1f}MB"
+        )
+
+
+def run_case(
+    name: str,
+    func: Callable[[], None],
+    items: int,
+    repeat: int = 5,
+    setup: Optional[Callable[[], None]] = None,
+) -> BenchmarkResult:
+    """
+    Time ``func`` over ``repeat`` runs and trace its peak allocation once.
+
+    :param name: Case name used in reports and baselines
+    :param func: Zero-argument callable exercising the hot path
+    :param items: Rows (or calls) processed per run, for throughput
+    :param repeat: Number of timed runs
+    :param setup: Untimed callable run before every timed and traced run
+    """
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    # Tracing slows allocation-heavy code, so memory gets its own run
+    if setup:
+        setup()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    p50, p95, p99 = np.percentile(timings, [50, 95, 99])
+    return BenchmarkResult(
+        name=name,
+        items=items,
+        repeat=repeat,
+        p50_s=float(p50),
+        p95_s=float(p95),
+        p99_s=float(p99),
+        throughput=items / p50 if p50 else float("inf"),
+        peak_mb=peak / 2**20,
+    )
+
+
+# --------------------------
+# Baselines
+# --------------------------
+
+
+def save_baseline(results: List[BenchmarkResult], path: Path) -> None:
+    """Write results as a JSON baseline keyed by case name."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {result.name: asdict(result) for result in results}
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+
+
+def load_baseline(path: Path) -> Dict[str, Dict]:
+    """Load a JSON baseline, or an empty one if none has been recorded."""
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def find_regressions(
+    results: List[BenchmarkResult], baseline: Dict[str, Dict], threshold: float
+) -> List[str]:
+    """
+    Compare median latencies against a baseline.
+
+    :param threshold: Allowed slowdown as a fraction, e.g. ``0.2`` for 20%
+    :return: Human-readable descriptions of every regressed case
+    """
+    regressions = []
+    for result in results:
+        reference = baseline.get(result.name)
+        if not reference or not reference.get("p50_s"):
+            continue
+        ratio = result.p50_s / reference["p50_s"]
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{result.name}: p50 {result.p50_s * 1e3:.2f}ms vs baseline "
+                f"{reference['p50_s'] * 1e3:.2f}ms ({ratio - 1:+.0%})"
+            )
+    return regressions
@@ -0,0 +1,163 @@
+import argparse
+import logging
+import sys
+import tempfile
+from pathlib import Path
+from typing import List
+
+import pandas as pd
+from sqlalchemy import create_engine, select
+
+from benchmarks.generators import generate_column_names, generate_frame, model_for
+from benchmarks.runner import (
+    BenchmarkResult,
+    find_regressions,
+    load_baseline,
+    run_case,
+    save_baseline,
+)
+from src.data.cleaning import clean_data, sanitize_column_name
+from src.database.manager import DatabaseManager
+from src.logging.logging import AppLogger
+
+# Configuration
+PROJECT_ROOT = Path(__file__).parent.parent
+BASELINE_DIR = Path(__file__).parent / "baselines"
+# Matches docker-compose-analysis.yml
+POSTGRES_DEFAULTS = {
+    "host": "localhost",
+    "port": 5432,
+    "name": "analysis-example",
+    "user": "postgres",
+    "password": "mysecretpassword",
+}
+
+
+def build_manager(args: argparse.Namespace, workdir: Path) -> DatabaseManager:
+    """Create a DatabaseManager for the selected backend."""
+    logger = AppLogger(
+        name="benchmarks",
+        log_path=PROJECT_ROOT / "logs/benchmarks.log",
+        console_level=logging.WARNING,
+    )
+    if args.backend == "postgres":
+        if args.db_config:
+            return DatabaseManager.from_yaml(args.db_config, logger)
+        return DatabaseManager({"database": dict(POSTGRES_DEFAULTS)}, logger)
+
+    manager = DatabaseManager({}, logger)
+    # The manager only builds PostgreSQL URLs; hand it a file-backed SQLite engine
+    manager._engine = create_engine(f"sqlite:///{workdir / 'benchmark.db'}")
+    return manager
+
+
+def run_suite(args: argparse.Namespace, db: DatabaseManager) -> List[BenchmarkResult]:
+    """Run every benchmark case against one backend."""
+    raw = generate_frame(
+        args.rows, args.columns, args.string_ratio, args.na_ratio, seed=args.seed
+    )
+    names = generate_column_names(10_000, seed=args.seed)
+    config = {"drop_na": False}
+    results = [
+        run_case(
+            "sanitize_column_name",
+            lambda: [sanitize_column_name(name) for name in names],
+            items=len(names),
+            repeat=args.repeat,
+        ),
+        run_case(
+            "clean_data",
+            lambda: clean_data(raw.copy(), config),
+            items=len(raw),
+            repeat=args.repeat,
+        ),
+    ]
+
+    cleaned = clean_data(raw.copy(), config)
+    model = model_for(raw)
+    table = model.__table__
+
+    def reset_table():
+        table.drop(db.engine, checkfirst=True)
+        db.create_tables([model])
+
+    results.append(
+        run_case(
+            f"insert_dataframe[{args.backend}]",
+            lambda: db.insert_dataframe(cleaned, model),
+            items=len(cleaned),
+            repeat=args.repeat,
+            setup=reset_table,
+        )
+    )
+
+    first_value = next(c for c in table.columns if c.name.startswith("value_col"))
+    query = select(table).where(first_value > 0)
+    returned = len(pd.read_sql(query, db.engine))
+    results.append(
+        run_case(
+            f"query[{args.backend}]",
+            lambda: pd.read_sql(query, db.engine),
+            items=returned,
+            repeat=args.repeat,
+        )
+    )
+    table.drop(db.engine, checkfirst=True)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ingest, clean and query paths")
+    parser.add_argument("--backend", choices=["sqlite", "postgres"], default="sqlite")
+    parser.add_argument("--db-config", type=Path, help="Database YAML for postgres")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--columns", type=int, default=20)
+    parser.add_argument("--string-ratio", type=float, default=0.3)
+    parser.add_argument("--na-ratio", type=float, default=0.05)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed p50 slowdown vs baseline before failing (fraction)",
+    )
+    parser.add_argument("--baseline", type=Path, help="Baseline JSON path")
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="Record results as the new baseline"
+    )
+    args = parser.parse_args()
+
+    baseline_path = args.baseline or BASELINE_DIR / f"{args.backend}.json"
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db = build_manager(args, Path(workdir))
+        try:
+            results = run_suite(args, db)
+        finally:
+            db.dispose()
+
+    for result in results:
+        print(result.format())
+
+    if args.save_baseline:
+        save_baseline(results, baseline_path)
+        print(f"\nBaseline saved to {baseline_path}")
+        return
+
+    baseline = load_baseline(baseline_path)
+    if not baseline:
+        print(f"\nNo baseline found at {baseline_path}; record one with --save-baseline")
+        sys.exit(1)
+
+    regressions = find_regressions(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f" - {regression}")
+        sys.exit(1)
+    print("\nNo regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,11 @@
 import argparse
+import fnmatch
+import os
+import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Set
+from typing import List, NamedTuple
 
 # Configuration
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -19,29 +23,92 @@ ARTIFACT_PATTERNS = {
     "exclude_dirs": {".git", ".venv", ".idea", "data/raw", "data/cleaned"},
 }
 
+# All file patterns folded into a single regex, matched against file names
+FILE_MATCHER = re.compile(
+    "|".join(fnmatch.translate(pattern) for pattern in ARTIFACT_PATTERNS["files"])
+)
+# Bare names are excluded at any depth; paths are relative to the root
+EXCLUDE_NAMES = {e for e in ARTIFACT_PATTERNS["exclude_dirs"] if "/" not in e}
+EXCLUDE_PATHS = {e for e in ARTIFACT_PATTERNS["exclude_dirs"] if "/" in e}
 
-def find_artifacts(root: Path, dry_run: bool = False) -> List[Path]:
+
+class Artifact(NamedTuple):
+    path: Path
+    is_dir: bool
+
+
+def find_artifacts(root: Path) -> List[Artifact]:
+    """Walk the tree, pruning excluded and artifact directories before descending."""
     found = []
+    stack = [(root, "")]
 
-    for path in root.rglob("*"):
-        if any(excl in path.parts for excl in ARTIFACT_PATTERNS["exclude_dirs"]):
+    while stack:
+        directory, relative = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except (PermissionError, FileNotFoundError):
             continue
 
-        # Check directory patterns
-        if path.is_dir() and path.name in ARTIFACT_PATTERNS["directories"]:
-            found.append(path)
-            if not dry_run:
-                shutil.rmtree(path)
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                rel_path = f"{relative}{entry.name}"
+                if entry.name in EXCLUDE_NAMES or rel_path in EXCLUDE_PATHS:
+                    continue
+                if entry.name in ARTIFACT_PATTERNS["directories"]:
+                    found.append(Artifact(Path(entry.path), True))
+                else:
+                    stack.append((entry.path, f"{rel_path}/"))
+            elif FILE_MATCHER.match(entry.name):
+                found.append(Artifact(Path(entry.path), False))
+
+    return found
+
+
+def _tree_size(path: str) -> int:
+    """Total size in bytes of all files below a directory."""
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            entries = list(os.scandir(stack.pop()))
+        except (PermissionError, FileNotFoundError):
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+            else:
+                total += entry.stat(follow_symlinks=False).st_size
+    return total
 
-        # Check file patterns
-        elif path.is_file() and any(
-            path.match(pattern) for pattern in ARTIFACT_PATTERNS["files"]
-        ):
-            found.append(path)
+
+def _remove(artifact: Artifact, dry_run: bool) -> int:
+    """Delete one artifact and return the bytes it occupied."""
+    try:
+        if artifact.is_dir:
+            size = _tree_size(str(artifact.path))
+            if not dry_run:
+                shutil.rmtree(artifact.path)
+        else:
+            size = artifact.path.stat().st_size
             if not dry_run:
-                path.unlink()
+                artifact.path.unlink()
+    except FileNotFoundError:
+        return 0
+    return size
+
+
+def remove_artifacts(artifacts: List[Artifact], dry_run: bool = False, workers: int = 8) -> int:
+    """Delete artifacts in parallel and return the total bytes reclaimed."""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return sum(executor.map(lambda a: _remove(a, dry_run), artifacts))
 
-    return found
+
+def _format_bytes(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
 
 
 def main():
@@ -49,18 +116,23 @@ def main():
     parser.add_argument(
         "--dry-run", action="store_true", help="Show what would be deleted"
     )
+    parser.add_argument(
+        "--workers", type=int, default=8, help="Parallel deletion threads"
+    )
     args = parser.parse_args()
 
-    artifacts = find_artifacts(PROJECT_ROOT, args.dry_run)
+    artifacts = find_artifacts(PROJECT_ROOT)
 
     print(f"Found {len(artifacts)} artifacts to clean:")
     for artifact in artifacts:
-        print(f" - {artifact.relative_to(PROJECT_ROOT)}")
+        print(f" - {artifact.path.relative_to(PROJECT_ROOT)}")
+
+    reclaimed = remove_artifacts(artifacts, args.dry_run, args.workers)
 
     if args.dry_run:
-        print("\nDry run completed - no files were deleted")
+        print(f"\nDry run completed - {_format_bytes(reclaimed)} would be reclaimed")
     else:
-        print("\nSuccessfully cleaned project artifacts")
+        print(f"\nSuccessfully cleaned project artifacts - {_format_bytes(reclaimed)} reclaimed")
 
 
 if __name__ == "__main__":
@@ -1,5 +1,42 @@
 from .cleaning import clean_data
+from .dedup import Deduplicator, HashSet, hash_keys
+from .excel import clean_excel_to_parquet, iter_excel_chunks
+from .sampling import (
+    bernoulli_sample,
+    reservoir_sample,
+    sample_parquet,
+    stratified_sample,
+)
+from .storage import (
+    ParquetChunkWriter,
+    iter_parquet,
+    read_feather,
+    read_parquet,
+    save_output,
+    write_feather,
+    write_parquet,
+)
+from .validation import Rule, ValidationResult, Validator
 
 __all__ = [
+    "bernoulli_sample",
     "clean_data",
+    "clean_excel_to_parquet",
+    "Deduplicator",
+    "hash_keys",
+    "HashSet",
+    "iter_excel_chunks",
+    "iter_parquet",
+    "ParquetChunkWriter",
+    "read_feather",
+    "read_parquet",
+    "reservoir_sample",
+    "Rule",
+    "sample_parquet",
+    "save_output",
+    "stratified_sample",
+    "ValidationResult",
+    "Validator",
+    "write_feather",
+    "write_parquet",
 ]
@@ -2,6 +2,8 @@ import re
 import pandas as pd
 from typing import Dict, Any
 
+from src.data.storage import save_output
+
 
 def sanitize_column_name(column_name: str) -> str:
     """
@@ -36,7 +38,12 @@ def sanitize_column_name(column_name: str) -> str:
 
 
 def clean_data(df: pd.DataFrame, cleaning_config: Dict[str, Any]) -> pd.DataFrame:
-    """Clean DataFrame with configurable options."""
+    """Clean DataFrame with configurable options.
+
+    When ``cleaning_config`` has an ``output`` section the cleaned frame is
+    also persisted through ``save_output`` (Parquet or Feather). Set
+    ``mode: append`` there when calling once per streamed chunk.
+    """
     try:
         # Apply column name sanitization
         if cleaning_config.get("sanitize_columns", True):
@@ -49,6 +56,9 @@ def clean_data(df: pd.DataFrame, cleaning_config: Dict[str, Any]) -> pd.DataFram
         # Additional cleaning steps
         if cleaning_config.get("strip_strings", True):
             df = df.map(lambda x: x.strip() if isinstance(x, str) else x)
+
+        if output_config := cleaning_config.get("output"):
+            save_output(df, output_config)
         return df
 
     except Exception as e:
@@ -0,0 +1,205 @@
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+def hash_keys(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    """
+    Hash the key columns of every row into a single uint64.
+
+    Hashes depend on both value and dtype (``1`` and ``"1"`` differ), so key
+    columns must be cast consistently before comparing frames from different
+    sources.
+
+    :param df: Frame to hash
+    :param columns: Key columns identifying a row
+    :return: One uint64 hash per row
+    """
+    return pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+
+
+def _in_sorted(run: np.ndarray, hashes: np.ndarray) -> np.ndarray:
+    """Membership of ``hashes`` in a sorted unique array via binary search."""
+    if not len(run):
+        return np.zeros(len(hashes), dtype=bool)
+    positions = np.searchsorted(run, hashes)
+    positions[positions == len(run)] = 0
+    return run[positions] == hashes
+
+
+class HashSet:
+    """Compact set of uint64 row hashes backed by sorted NumPy runs.
+
+    Keys cost 8 bytes each. Every ``add`` stores its new keys as a sorted run,
+    and runs are merged like a binary counter (a run is folded into its
+    predecessor once it is at least as large). That keeps O(log n) runs, each
+    key is re-sorted O(log n) times, and lookups are one binary search per
+    run, so streaming n keys costs O(n log n) overall rather than re-sorting
+    everything per chunk.
+
+    Once the in-memory runs reach ``spill_threshold`` keys and a
+    ``spill_dir`` is configured, they are merged, written to disk and
+    memory-mapped read-only, bounding the resident footprint.
+    """
+
+    def __init__(
+        self, spill_dir: Optional[Path] = None, spill_threshold: int = 50_000_000
+    ) -> None:
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        self.spill_threshold = spill_threshold
+        self._runs: List[np.ndarray] = []
+        self._spilled: List[np.ndarray] = []
+        self._spill_files: List[Path] = []
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        """Boolean mask of which hashes are already in the set."""
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        order = np.argsort(hashes)
+        mask = np.empty(len(hashes), dtype=bool)
+        mask[order] = self._contains_sorted(hashes[order])
+        return mask
+
+    def _contains_sorted(self, hashes: np.ndarray) -> np.ndarray:
+        """Membership mask for sorted hashes; ordered needles keep the searches cache friendly."""
+        mask = np.zeros(len(hashes), dtype=bool)
+        for run in self._runs + self._spilled:
+            mask |= _in_sorted(run, hashes)
+        return mask
+
+    def add(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Insert hashes; repeats and keys already present are stored once.
+
+        :param hashes: uint64 hashes to insert
+        :return: Mask of the hashes that were present before this call
+        """
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        order = np.argsort(hashes)
+        ordered = hashes[order]
+        present = self._contains_sorted(ordered)
+        mask = np.empty(len(hashes), dtype=bool)
+        mask[order] = present
+
+        new = ordered[~present]
+        if len(new):
+            new = new[np.concatenate(([True], new[1:] != new[:-1]))]
+        if not len(new):
+            return mask
+        self._runs.append(new)
+        self._size += len(new)
+
+        while len(self._runs) >= 2 and len(self._runs[-2]) <= len(self._runs[-1]):
+            last = self._runs.pop()
+            self._runs.append(self._merge(self._runs.pop(), last))
+
+        if self.spill_dir and sum(len(run) for run in self._runs) >= self.spill_threshold:
+            self._spill()
+        return mask
+
+    @staticmethod
+    def _merge(*runs: np.ndarray) -> np.ndarray:
+        """Merge disjoint sorted runs (timsort merges the presorted halves in linear time)."""
+        merged = np.concatenate(runs)
+        merged.sort(kind="stable")
+        return merged
+
+    def _spill(self) -> None:
+        """Move the in-memory runs to a memory-mapped file."""
+        self.spill_dir.mkdir(parents=True, exist_ok=True)
+        path = self.spill_dir / f"hashes-{len(self._spill_files):05d}.npy"
+        np.save(path, self._merge(*self._runs))
+        self._spill_files.append(path)
+        self._spilled.append(np.load(path, mmap_mode="r"))
+        self._runs = []
+
+    def close(self) -> None:
+        """Release memory maps and delete spill files."""
+        self._spilled = []
+        for path in self._spill_files:
+            path.unlink(missing_ok=True)
+        self._spill_files = []
+
+
+class Deduplicator:
+    """Drop duplicate rows by key within a frame and across a stream of chunks.
+
+    The first occurrence of each key wins. Optionally seed the set with keys
+    already present in the target table so the database never receives rows
+    it has already stored.
+
+    Usage:
+    >>> dedup = Deduplicator(["order_id", "line_no"], spill_dir=Path("data/tmp"))
+    >>> dedup.seed_from_database(db, "order_lines")
+    >>> for chunk in dedup.iter_unique(chunks):
+    ...     db.insert_dataframe(chunk, OrderLine)
+    """
+
+    def __init__(
+        self,
+        columns: List[str],
+        spill_dir: Optional[Path] = None,
+        spill_threshold: int = 50_000_000,
+    ) -> None:
+        self.columns = list(columns)
+        self.seen = HashSet(spill_dir, spill_threshold)
+        self.rows = 0
+        self.dropped = 0
+
+    def duplicated(self, df: pd.DataFrame) -> np.ndarray:
+        """Flag rows whose key was seen earlier in this frame or a previous one.
+
+        Non-duplicate keys are recorded, so calling this consumes the frame.
+        """
+        hashes = hash_keys(df, self.columns)
+        repeated = pd.Series(hashes).duplicated().to_numpy()
+        return self.seen.add(hashes) | repeated
+
+    def drop_duplicates(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Return the rows of ``df`` whose keys have not been seen before."""
+        duplicated = self.duplicated(df)
+        self.rows += len(df)
+        self.dropped += int(duplicated.sum())
+        return df[~duplicated]
+
+    def iter_unique(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """Deduplicate a stream of chunks, skipping chunks left empty."""
+        for chunk in chunks:
+            unique = self.drop_duplicates(chunk)
+            if len(unique):
+                yield unique
+
+    def seed_from_database(
+        self,
+        db,
+        table_name: str,
+        dtypes: Optional[Dict[str, str]] = None,
+        chunksize: int = 500_000,
+    ) -> int:
+        """Record every key already stored in ``table_name``.
+
+        Args:
+            db: DatabaseManager for the target database
+            table_name: Table whose existing keys should be skipped
+            dtypes: Casts applied to fetched key columns so their hashes match
+                the incoming frames
+            chunksize: Rows fetched per round trip
+
+        Returns:
+            Number of existing keys recorded
+        """
+        before = len(self.seen)
+        for keys in db.iter_table_columns(table_name, self.columns, chunksize):
+            if dtypes:
+                keys = keys.astype(dtypes)
+            self.seen.add(hash_keys(keys, self.columns))
+        return len(self.seen) - before
+
+    def close(self) -> None:
+        """Delete any on-disk spill files."""
+        self.seen.close()
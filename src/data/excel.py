@@ -0,0 +1,165 @@
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import pandas as pd
+import pyarrow as pa
+from openpyxl import load_workbook
+
+from src.data.cleaning import clean_data, sanitize_column_name
+from src.data.storage import ParquetChunkWriter
+
+
+def sheet_names(path: Path) -> List[str]:
+    """List the worksheet names of a workbook without loading any cells."""
+    workbook = load_workbook(Path(path), read_only=True)
+    try:
+        return list(workbook.sheetnames)
+    finally:
+        workbook.close()
+
+
+def _header(values: Sequence[Any], sanitize: bool) -> List[str]:
+    """Build column names from a header row, filling blanks positionally."""
+    columns = []
+    for position, value in enumerate(values):
+        name = f"column_{position}" if value is None else str(value)
+        columns.append(sanitize_column_name(name) if sanitize else name)
+    return columns
+
+
+def iter_excel_chunks(
+    path: Path,
+    sheet_name: Optional[str] = None,
+    chunksize: int = 50_000,
+    header_row: int = 1,
+    sanitize_columns: bool = True,
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream a worksheet as DataFrame chunks using openpyxl read-only mode.
+
+    Rows are pulled lazily from the XML stream, so memory stays bounded by
+    ``chunksize`` regardless of the workbook size.
+
+    :param path: Path to the ``.xlsx`` workbook
+    :param sheet_name: Worksheet to read (defaults to the active sheet)
+    :param chunksize: Maximum rows per yielded chunk
+    :param header_row: 1-based row holding the column names
+    :param sanitize_columns: Pass header names through ``sanitize_column_name``
+    """
+    workbook = load_workbook(Path(path), read_only=True, data_only=True)
+    try:
+        sheet = workbook[sheet_name] if sheet_name else workbook.active
+        rows = sheet.iter_rows(min_row=header_row, values_only=True)
+
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = _header(header, sanitize_columns)
+        width = len(columns)
+
+        buffer = []
+        for row in rows:
+            # Read-only mode can report trailing formatted-but-empty rows
+            if all(value is None for value in row):
+                continue
+            buffer.append(row[:width] + (None,) * (width - len(row)))
+            if len(buffer) >= chunksize:
+                yield pd.DataFrame.from_records(buffer, columns=columns)
+                buffer = []
+
+        if buffer:
+            yield pd.DataFrame.from_records(buffer, columns=columns)
+    finally:
+        workbook.close()
+
+
+def _sheet_dirs(sheets: List[str], output_dir: Path) -> Dict[str, Path]:
+    """Give every sheet its own output directory.
+
+    Distinct sheet names can sanitize to the same directory (``Sales Data``
+    and ``Sales-Data``); later ones get a numeric suffix so parallel workers
+    never share, and wipe, one directory.
+    """
+    dirs, taken = {}, set()
+    for sheet in sheets:
+        base = name = sanitize_column_name(sheet)
+        suffix = 2
+        while name in taken:
+            name = f"{base}_{suffix}"
+            suffix += 1
+        taken.add(name)
+        dirs[sheet] = Path(output_dir) / name
+    return dirs
+
+
+def _clean_sheet_to_parquet(
+    path: Path,
+    sheet_name: str,
+    sheet_dir: Path,
+    cleaning_config: Dict[str, Any],
+    chunksize: int,
+    schema: Optional[pa.Schema],
+) -> Path:
+    """Worker: stream one sheet through ``clean_data`` into a single Parquet file."""
+    sheet_dir = Path(sheet_dir)
+    # Start clean so a rerun never mixes with files from a previous run
+    shutil.rmtree(sheet_dir, ignore_errors=True)
+    sheet_dir.mkdir(parents=True)
+
+    with ParquetChunkWriter(sheet_dir / "part-00000.parquet", schema) as writer:
+        for chunk in iter_excel_chunks(path, sheet_name, chunksize):
+            writer.write(clean_data(chunk, cleaning_config))
+    return sheet_dir
+
+
+def clean_excel_to_parquet(
+    path: Path,
+    output_dir: Path,
+    cleaning_config: Dict[str, Any],
+    sheets: Optional[List[str]] = None,
+    chunksize: int = 50_000,
+    max_workers: Optional[int] = None,
+    schemas: Optional[Dict[str, pa.Schema]] = None,
+) -> Dict[str, Path]:
+    """
+    Clean every sheet of a workbook into Parquet, one process per sheet.
+
+    Each worker streams its sheet chunk by chunk into one Parquet file, so
+    peak memory is roughly ``max_workers * chunksize`` rows. Each sheet gets
+    one schema, inferred from its first chunk unless given in ``schemas``
+    (integer columns stay int64 unless a later chunk holds fractions), and
+    a sheet's directory is replaced on every run. Directories are named
+    after the sanitized sheet name, with a ``_2``, ``_3``... suffix when two
+    sheets sanitize alike. The resulting directories can be loaded with
+    ``DatabaseManager.insert_parquet``.
+
+    :param path: Path to the ``.xlsx`` workbook
+    :param output_dir: Directory receiving one Parquet dataset per sheet
+    :param cleaning_config: Options forwarded to ``clean_data``
+    :param sheets: Sheets to process (defaults to all)
+    :param chunksize: Maximum rows per chunk
+    :param max_workers: Process pool size (defaults to CPU count)
+    :param schemas: Optional Arrow schema per sheet name (post-cleaning columns)
+    :return: Mapping of sheet name to its Parquet dataset directory
+    """
+    sheets = sheets or sheet_names(path)
+    # Chunks are written by the worker; an ``output`` section would write them twice
+    chunk_config = {k: v for k, v in cleaning_config.items() if k != "output"}
+    sheet_dirs = _sheet_dirs(sheets, output_dir)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            sheet: executor.submit(
+                _clean_sheet_to_parquet,
+                path,
+                sheet,
+                sheet_dirs[sheet],
+                chunk_config,
+                chunksize,
+                (schemas or {}).get(sheet),
+            )
+            for sheet in sheets
+        }
+        return {sheet: future.result() for sheet, future in futures.items()}
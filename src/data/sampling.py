@@ -0,0 +1,200 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.data.storage import Filters, iter_parquet, read_feather, write_feather
+
+
+SAMPLE_KEY = "_sample_key"
+
+
+def _keyed(chunk: pd.DataFrame, rng: np.random.Generator) -> pd.DataFrame:
+    """Attach a uniform random key to every row of a chunk."""
+    return chunk.assign(**{SAMPLE_KEY: rng.random(len(chunk))})
+
+
+def reservoir_sample(
+    chunks: Iterable[pd.DataFrame], n: int, seed: int = 0
+) -> pd.DataFrame:
+    """
+    Draw a uniform sample of ``n`` rows from a stream in one pass.
+
+    Every row gets a random key and the ``n`` smallest keys are kept
+    (bottom-k sampling), which is equivalent to a classic reservoir but
+    vectorized per chunk. Memory is bounded by ``n`` plus one chunk.
+
+    :param chunks: Stream of DataFrame chunks with identical columns
+    :param n: Sample size
+    :param seed: Random seed; same seed and chunk order give the same sample
+    :return: Sampled rows (fewer than ``n`` if the stream is shorter)
+    """
+    rng = np.random.default_rng(seed)
+    reservoir = None
+    for chunk in chunks:
+        keyed = _keyed(chunk, rng)
+        if reservoir is not None:
+            keyed = pd.concat([reservoir, keyed], ignore_index=True)
+        reservoir = keyed.nsmallest(n, SAMPLE_KEY)
+
+    if reservoir is None:
+        return pd.DataFrame()
+    return reservoir.sort_values(SAMPLE_KEY).drop(columns=SAMPLE_KEY).reset_index(drop=True)
+
+
+def bernoulli_sample(
+    chunks: Iterable[pd.DataFrame], fraction: float, seed: int = 0
+) -> pd.DataFrame:
+    """Keep each row independently with probability ``fraction``, in one pass."""
+    rng = np.random.default_rng(seed)
+    kept = [chunk[rng.random(len(chunk)) < fraction] for chunk in chunks]
+    if not kept:
+        return pd.DataFrame()
+    return pd.concat(kept, ignore_index=True)
+
+
+def stratified_sample(
+    chunks: Iterable[pd.DataFrame],
+    by: str,
+    n: Optional[int] = None,
+    fraction: Optional[float] = None,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    Sample every stratum of ``by`` in one pass over a stream.
+
+    With ``n``, each stratum keeps up to ``n`` uniformly chosen rows (a
+    reservoir per stratum). With ``fraction``, rows are kept independently,
+    giving a proportional sample of every stratum.
+
+    :param chunks: Stream of DataFrame chunks
+    :param by: Stratum column
+    :param n: Rows per stratum
+    :param fraction: Proportion of each stratum to keep
+    :param seed: Random seed
+    """
+    if (n is None) == (fraction is None):
+        raise ValueError("Specify exactly one of 'n' or 'fraction'")
+    if fraction is not None:
+        return bernoulli_sample(chunks, fraction, seed)
+
+    rng = np.random.default_rng(seed)
+    reservoir = None
+    for chunk in chunks:
+        keyed = _keyed(chunk, rng)
+        if reservoir is not None:
+            keyed = pd.concat([reservoir, keyed], ignore_index=True)
+        reservoir = keyed.sort_values(SAMPLE_KEY).groupby(by, sort=False, dropna=False).head(n)
+
+    if reservoir is None:
+        return pd.DataFrame()
+    return (
+        reservoir.sort_values([by, SAMPLE_KEY])
+        .drop(columns=SAMPLE_KEY)
+        .reset_index(drop=True)
+    )
+
+
+def _source_version(path: Path) -> list:
+    """
+    Fingerprint a file or dataset directory by its files' sizes and mtimes.
+
+    Rewriting, appending to or deleting any part file changes the result, so
+    cached samples keyed on it are rebuilt instead of served stale.
+    """
+    path = Path(path)
+    if path.is_file():
+        stat = path.stat()
+        return [[path.name, stat.st_size, stat.st_mtime_ns]]
+    entries = []
+    for file in sorted(p for p in path.rglob("*") if p.is_file()):
+        stat = file.stat()
+        entries.append([file.relative_to(path).as_posix(), stat.st_size, stat.st_mtime_ns])
+    return entries
+
+
+def sample_parquet(
+    path: Path,
+    n: Optional[int] = None,
+    fraction: Optional[float] = None,
+    by: Optional[str] = None,
+    columns: Optional[Sequence[str]] = None,
+    filters: Filters = None,
+    seed: int = 0,
+    batch_size: int = 100_000,
+    cache_dir: Optional[Path] = None,
+) -> pd.DataFrame:
+    """
+    Sample a Parquet dataset in one streamed pass.
+
+    Column projection and filters are pushed down before sampling, so only
+    the data needed for the sample is decoded.
+
+    :param path: Parquet file or dataset directory
+    :param n: Sample size (per stratum when ``by`` is given)
+    :param fraction: Proportion of rows to keep instead of a fixed size
+    :param by: Optional stratum column
+    :param columns: Columns to load (defaults to all)
+    :param filters: DNF filters pushed down to the scanner
+    :param seed: Random seed
+    :param batch_size: Rows per streamed chunk
+    :param cache_dir: Cache the sample by its parameters and the source files'
+        sizes and mtimes under this directory
+    """
+    params = {
+        "source": str(Path(path).resolve()),
+        "version": _source_version(path),
+        "n": n,
+        "fraction": fraction,
+        "by": by,
+        "columns": list(columns) if columns else None,
+        "filters": filters,
+        "seed": seed,
+        "batch_size": batch_size,
+    }
+
+    def build() -> pd.DataFrame:
+        chunks = iter_parquet(path, columns=columns, filters=filters, batch_size=batch_size)
+        if by is not None:
+            return stratified_sample(chunks, by, n=n, fraction=fraction, seed=seed)
+        if fraction is not None:
+            return bernoulli_sample(chunks, fraction, seed)
+        if n is None:
+            raise ValueError("Specify 'n' or 'fraction'")
+        return reservoir_sample(chunks, n, seed)
+
+    return cached_sample(cache_dir, params, build)
+
+
+def cached_sample(
+    cache_dir: Optional[Path],
+    params: Dict[str, Any],
+    build: Callable[[], pd.DataFrame],
+) -> pd.DataFrame:
+    """
+    Return a sample from the Feather cache, building and storing it on a miss.
+
+    Samples are keyed by a hash of ``params`` (which must include the seed),
+    so re-running a notebook with the same arguments memory-maps the stored
+    subset instead of touching the source again. ``params`` must also carry a
+    version of the source data; otherwise a reloaded source keeps returning
+    the old sample.
+
+    :param cache_dir: Cache directory, or None to always build
+    :param params: JSON-serialisable description of the sample
+    :param build: Callable producing the sample on a cache miss
+    """
+    if cache_dir is None:
+        return build()
+
+    digest = hashlib.sha1(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+    path = Path(cache_dir) / f"sample-{digest[:16]}.feather"
+    if path.exists():
+        return read_feather(path)
+
+    sample = build()
+    write_feather(sample, path)
+    return sample
@@ -0,0 +1,365 @@
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+
+
+# DNF filters as accepted by pandas/pyarrow, e.g. [("year", "=", 2024)]
+Filters = Optional[Union[List[Tuple[str, str, Any]], List[List[Tuple[str, str, Any]]]]]
+# Dataset-wide schema kept next to the part files (ignored by the scanner)
+COMMON_METADATA = "_common_metadata"
+# Raised by the scanner when a part file does not match the dataset schema
+SCHEMA_ERRORS = (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError)
+
+
+def _to_expression(filters: Filters) -> Optional[ds.Expression]:
+    """Convert DNF filter tuples into a dataset expression."""
+    if not filters:
+        return None
+    return pq.filters_to_expression(filters)
+
+
+def write_parquet(
+    df: pd.DataFrame,
+    path: Path,
+    partition_cols: Optional[List[str]] = None,
+    compression: str = "zstd",
+    compression_level: Optional[int] = None,
+    row_group_size: Optional[int] = None,
+    append: bool = False,
+) -> Path:
+    """
+    Write a DataFrame as a (optionally hive-partitioned) Parquet dataset.
+
+    By default the target is replaced: a single file when not partitioned,
+    or the touched partitions otherwise. With ``append=True`` the path is a
+    dataset directory and every call adds uniquely named part files, so
+    streamed chunks can be written one call at a time. Dataset directories
+    keep the union of every written schema in ``_common_metadata``, which
+    readers use instead of opening every part file.
+
+    :param df: DataFrame to write
+    :param path: Dataset directory (or file path when neither partitioned nor appending)
+    :param partition_cols: Columns to partition the dataset directory by
+    :param compression: Parquet codec (``zstd``, ``snappy``, ``gzip``, ``none``)
+    :param compression_level: Optional codec-specific compression level
+    :param row_group_size: Maximum rows per row group
+    :param append: Add part files to an existing dataset instead of replacing it
+    :return: The path written to
+    """
+    path = Path(path)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    if partition_cols or append:
+        path.mkdir(parents=True, exist_ok=True)
+        pq.write_to_dataset(
+            table,
+            root_path=path,
+            partition_cols=partition_cols,
+            basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet" if append else None,
+            compression=compression,
+            compression_level=compression_level,
+            row_group_size=row_group_size,
+            existing_data_behavior="overwrite_or_ignore" if append else "delete_matching",
+        )
+        _record_schema(path, table.schema)
+    else:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(
+            table,
+            path,
+            compression=compression,
+            compression_level=compression_level,
+            row_group_size=row_group_size,
+        )
+    return path
+
+
+def _record_schema(path: Path, schema: pa.Schema) -> None:
+    """Merge ``schema`` into the dataset's ``_common_metadata`` file."""
+    target = path / COMMON_METADATA
+    schema = schema.remove_metadata()
+    if target.exists():
+        schema = pa.unify_schemas(
+            [pq.read_schema(target), schema], promote_options="permissive"
+        )
+    partial = path / f"{COMMON_METADATA}.{uuid.uuid4().hex[:8]}.tmp"
+    pq.write_metadata(schema, partial)
+    partial.replace(target)
+
+
+def _dataset(path: Path, schema: Optional[pa.Schema] = None) -> ds.Dataset:
+    """
+    Open a Parquet file or hive-partitioned directory as a dataset.
+
+    The schema is ``schema`` when given, else the ``_common_metadata`` kept
+    by ``write_parquet``, else whatever discovery infers from the first part
+    file. No other footers are read up front, so a filtered read only opens
+    the files it scans.
+    """
+    path = Path(path)
+    if schema is None and (path / COMMON_METADATA).is_file():
+        schema = pq.read_schema(path / COMMON_METADATA)
+    return ds.dataset(path, format="parquet", partitioning="hive", schema=schema)
+
+
+def _unified_dataset(path: Path) -> ds.Dataset:
+    """
+    Open a dataset under the union of all its part files' schemas.
+
+    Fallback for datasets without ``_common_metadata`` whose files disagree
+    (null columns take the type seen elsewhere, ints widen to floats); it
+    reads every footer.
+    """
+    dataset = ds.dataset(path, format="parquet", partitioning="hive")
+    unified = pa.unify_schemas(
+        [dataset.schema] + [fragment.physical_schema for fragment in dataset.get_fragments()],
+        promote_options="permissive",
+    )
+    return ds.dataset(path, format="parquet", partitioning="hive", schema=unified)
+
+
+def read_parquet(
+    path: Path,
+    columns: Optional[Sequence[str]] = None,
+    filters: Filters = None,
+    schema: Optional[pa.Schema] = None,
+) -> pd.DataFrame:
+    """
+    Read a Parquet dataset, loading only the requested columns and row groups.
+
+    Column projection and filters are pushed down to the scanner, so
+    partitions and row groups that cannot match are never decoded.
+
+    :param path: Parquet file or dataset directory
+    :param columns: Columns to load (defaults to all)
+    :param filters: DNF filters, e.g. ``[("region", "=", "eu")]``
+    :param schema: Schema to read every part file as (defaults to the recorded one)
+    :return: DataFrame with the selected rows and columns
+    """
+    scan = {"columns": list(columns) if columns else None, "filter": _to_expression(filters)}
+    try:
+        table = _dataset(path, schema).to_table(**scan)
+    except SCHEMA_ERRORS:
+        if schema is not None:
+            raise
+        table = _unified_dataset(path).to_table(**scan)
+    return table.to_pandas()
+
+
+def iter_parquet(
+    path: Path,
+    columns: Optional[Sequence[str]] = None,
+    filters: Filters = None,
+    batch_size: int = 100_000,
+    schema: Optional[pa.Schema] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream a Parquet dataset as DataFrame chunks of at most ``batch_size`` rows.
+
+    :param path: Parquet file or dataset directory
+    :param columns: Columns to load (defaults to all)
+    :param filters: DNF filters pushed down to the scanner
+    :param batch_size: Maximum rows per yielded chunk
+    :param schema: Schema to read every part file as (defaults to the recorded one)
+    """
+    scan = {
+        "columns": list(columns) if columns else None,
+        "filter": _to_expression(filters),
+        "batch_size": batch_size,
+    }
+    yielded = 0
+    try:
+        for batch in _dataset(path, schema).to_batches(**scan):
+            if batch.num_rows:
+                yielded += batch.num_rows
+                yield batch.to_pandas()
+        return
+    except SCHEMA_ERRORS:
+        if schema is not None:
+            raise
+
+    # Part files disagree and no schema was recorded: rescan under their
+    # union, skipping the rows already yielded (scan order is deterministic)
+    for batch in _unified_dataset(path).to_batches(**scan):
+        skip = min(yielded, batch.num_rows)
+        yielded -= skip
+        if batch.num_rows > skip:
+            yield batch.slice(skip).to_pandas()
+
+
+def widen_schema(schema: pa.Schema) -> pa.Schema:
+    """
+    Loosen a schema inferred from one chunk so later chunks still fit.
+
+    All-null columns become strings, since a later chunk may hold text where
+    the first was blank. Integers stay int64 (Arrow integers are nullable);
+    ``ParquetChunkWriter`` widens them only once a chunk actually needs it.
+    """
+    fields = []
+    for schema_field in schema:
+        if pa.types.is_null(schema_field.type):
+            schema_field = schema_field.with_type(pa.string())
+        fields.append(schema_field)
+    return pa.schema(fields)
+
+
+class ParquetChunkWriter:
+    """Append DataFrame chunks to one Parquet file under a single schema.
+
+    The schema is either given up front or inferred from the first chunk
+    (see ``widen_schema``); every chunk is cast to it and written as its own
+    row group. When an inferred schema cannot hold a later chunk (e.g.
+    fractional values in an integer column), the columns are promoted, as
+    int64 to float64, and the rows written so far are rewritten once under
+    the wider schema. A chunk that cannot be cast to a given schema, or whose
+    types cannot be promoted, raises instead of producing an unreadable file.
+
+    The file is written under a hidden temporary name and moved into place
+    by ``close``, so readers never see a half-written file.
+
+    Usage:
+    >>> with ParquetChunkWriter(Path("data/cleaned/orders/part-0.parquet")) as writer:
+    ...     for chunk in chunks:
+    ...         writer.write(chunk)
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        schema: Optional[pa.Schema] = None,
+        compression: str = "zstd",
+    ) -> None:
+        self.path = Path(path)
+        self.schema = schema
+        self.compression = compression
+        self.rows = 0
+        self._inferred = schema is None
+        self._writer = None
+        self._partial = None
+
+    def write(self, df: pd.DataFrame) -> None:
+        """Cast a chunk to the file schema and append it as a row group."""
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if self._writer is None:
+            if self.schema is None:
+                self.schema = widen_schema(table.schema.remove_metadata())
+            self._open()
+        table = table.select(self.schema.names)
+        try:
+            cast = table.cast(self.schema)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            if not self._inferred:
+                raise
+            self._promote(table.schema)
+            cast = table.cast(self.schema)
+        self._writer.write_table(cast)
+        self.rows += len(df)
+
+    def _open(self) -> None:
+        """Start a temporary file under the current schema."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._partial = self.path.with_name(f".{self.path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        self._writer = pq.ParquetWriter(self._partial, self.schema, compression=self.compression)
+
+    def _promote(self, incoming: pa.Schema) -> None:
+        """Widen the schema to fit ``incoming`` and rewrite the rows written so far."""
+        schema = pa.unify_schemas([self.schema, incoming], promote_options="permissive")
+        previous = self._partial
+        self._writer.close()
+        self.schema = schema
+        self._open()
+        for batch in pq.ParquetFile(previous).iter_batches():
+            self._writer.write_table(pa.Table.from_batches([batch]).cast(schema))
+        previous.unlink()
+
+    def close(self) -> None:
+        """Finalize the file footer and move the file into place."""
+        if self._writer is not None:
+            self._writer.close()
+            self._partial.replace(self.path)
+            self._writer = None
+
+    def __enter__(self) -> "ParquetChunkWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def write_feather(df: pd.DataFrame, path: Path, compression: str = "uncompressed") -> Path:
+    """
+    Write a DataFrame as an Arrow IPC (Feather v2) file.
+
+    Files must stay uncompressed to be memory-mapped by ``read_feather``.
+
+    :param df: DataFrame to write
+    :param path: Output file path
+    :param compression: ``uncompressed``, ``lz4`` or ``zstd``
+    :return: The path written to
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    feather.write_feather(table, path, compression=compression)
+    return path
+
+
+def read_feather(
+    path: Path,
+    columns: Optional[Sequence[str]] = None,
+    memory_map: bool = True,
+) -> pd.DataFrame:
+    """
+    Load an Arrow IPC file into pandas, memory-mapping it by default.
+
+    Numeric columns without nulls are handed to pandas without copying the
+    mapped buffers; other columns are converted as usual.
+
+    :param path: Feather file path
+    :param columns: Columns to load (defaults to all)
+    :param memory_map: Map the file instead of reading it into memory
+    :return: DataFrame backed by the mapped file where possible
+    """
+    table = feather.read_table(
+        Path(path),
+        columns=list(columns) if columns else None,
+        memory_map=memory_map,
+    )
+    return table.to_pandas(split_blocks=True)
+
+
+def save_output(df: pd.DataFrame, output_config: Dict[str, Any]) -> Path:
+    """
+    Persist a DataFrame according to an ``output`` config section.
+
+    Example config:
+        output:
+          path: data/cleaned/sales
+          format: parquet        # or feather
+          partition_cols: [year]
+          compression: zstd
+          mode: append           # add part files per call instead of overwriting
+    """
+    fmt = output_config.get("format", "parquet")
+    path = Path(output_config["path"])
+    if fmt == "parquet":
+        return write_parquet(
+            df,
+            path,
+            partition_cols=output_config.get("partition_cols"),
+            compression=output_config.get("compression", "zstd"),
+            compression_level=output_config.get("compression_level"),
+            row_group_size=output_config.get("row_group_size"),
+            append=output_config.get("mode", "overwrite") == "append",
+        )
+    if fmt == "feather":
+        return write_feather(
+            df, path, compression=output_config.get("compression", "uncompressed")
+        )
+    raise ValueError(f"Unsupported output format: {fmt}")
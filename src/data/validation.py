@@ -0,0 +1,273 @@
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.data.dedup import HashSet, hash_keys
+from src.data.storage import ParquetChunkWriter
+
+
+RULE_TYPES = {"not_null", "range", "allowed", "regex", "unique", "references", "null_rate"}
+FAILED_RULES_COLUMN = "_failed_rules"
+
+
+@dataclass
+class Rule:
+    """A single declarative check, as listed under ``validation.rules``.
+
+    Example config:
+        validation:
+          quarantine_path: data/quarantine/sales
+          rules:
+            - {name: amount_positive, type: range, column: amount, min: 0}
+            - {name: order_unique, type: unique, columns: [order_id]}
+            - {name: known_region, type: allowed, column: region, values: [eu, us]}
+            - {name: customer_fk, type: references, column: customer_id,
+               table: customers, key: id}
+            - {name: email_sparse, type: null_rate, column: email, max_rate: 0.2}
+    """
+
+    name: str
+    type: str
+    columns: List[str]
+    params: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "Rule":
+        config = dict(config)
+        rule_type = config.pop("type", None)
+        if rule_type not in RULE_TYPES:
+            raise ValueError(
+                f"Invalid rule type '{rule_type}'. "
+                f"Valid options: {', '.join(sorted(RULE_TYPES))}"
+            )
+        columns = config.pop("columns", None) or [config.pop("column")]
+        config.pop("column", None)
+        name = config.pop("name", f"{rule_type}_{'_'.join(columns)}")
+        return cls(name=name, type=rule_type, columns=list(columns), params=config)
+
+
+@dataclass
+class ValidationResult:
+    """Outcome of validating one frame or chunk."""
+
+    valid: pd.DataFrame
+    quarantine: pd.DataFrame
+    counts: Dict[str, int]
+
+
+class Validator:
+    """Vectorized rule evaluation with quarantine of failing rows.
+
+    Every rule produces a boolean failure mask over the whole frame; rows
+    failing any row-level rule are split into the quarantine frame with a
+    ``_failed_rules`` column naming the rules they broke. State needed across
+    chunks (seen unique keys, running counts) lives on the instance, so the
+    same validator can be fed a stream of chunks.
+
+    ``unique`` rules run last and only record keys of rows that are accepted,
+    so a rejected row never blocks a corrected one. Quarantined rows of one
+    run go to a single Parquet file under ``quarantine_path`` with a
+    run-specific name, with every data column stored as text since
+    quarantined values are exactly the ones whose types drift; call
+    ``close`` (done by ``validate_chunks``) to finalize it.
+
+    Usage:
+    >>> validator = Validator.from_config(load_config())
+    >>> for result in validator.validate_chunks(chunks):
+    ...     db.insert_dataframe(result.valid, Sale)
+    >>> validator.summary()
+    """
+
+    def __init__(
+        self,
+        rules: List[Rule],
+        quarantine_path: Optional[Path] = None,
+        reference_values: Optional[Dict[str, Iterable]] = None,
+    ) -> None:
+        self.rules = rules
+        self.quarantine_path = Path(quarantine_path) if quarantine_path else None
+        self.reference_values = {
+            name: pd.Index(values).unique()
+            for name, values in (reference_values or {}).items()
+        }
+        self.totals = {rule.name: 0 for rule in rules}
+        self.nulls = {rule.name: 0 for rule in rules if rule.type == "null_rate"}
+        self.rows = 0
+        self.quarantined = 0
+        self._seen_keys = {rule.name: HashSet() for rule in rules if rule.type == "unique"}
+        self._quarantine_writer = None
+        if self.quarantine_path:
+            run_id = f"{datetime.now():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}"
+            self._quarantine_writer = ParquetChunkWriter(
+                self.quarantine_path / f"part-{run_id}.parquet"
+            )
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], db=None) -> "Validator":
+        """Build a validator from the ``validation`` section of a config.
+
+        Args:
+            config: Full project config containing a ``validation`` section
+            db: Optional DatabaseManager used to fetch keys for
+                ``references`` rules that name a ``table``
+        """
+        section = config.get("validation", {})
+        rules = [Rule.from_dict(rule) for rule in section.get("rules", [])]
+
+        references = {}
+        for rule in rules:
+            if rule.type != "references" or "values" in rule.params:
+                continue
+            if db is None:
+                raise ValueError(f"Rule '{rule.name}' needs a DatabaseManager to load keys")
+            references[rule.name] = db.fetch_column_values(
+                rule.params["table"], rule.params.get("key", rule.columns[0])
+            )
+
+        return cls(rules, section.get("quarantine_path"), references)
+
+    # --------------------------
+    # Rule Evaluation
+    # --------------------------
+
+    def _failures(self, rule: Rule, df: pd.DataFrame) -> pd.Series:
+        """Boolean mask of rows violating a row-level rule."""
+        column = df[rule.columns[0]]
+        params = rule.params
+
+        if rule.type == "not_null":
+            return df[rule.columns].isna().any(axis=1)
+
+        if rule.type == "range":
+            values = column
+            if not pd.api.types.is_datetime64_any_dtype(column):
+                # Stray text such as "n/a" fails the rule instead of the comparison
+                values = pd.to_numeric(column, errors="coerce")
+            mask = values.isna()
+            if "min" in params:
+                mask |= values < params["min"]
+            if "max" in params:
+                mask |= values > params["max"]
+            return mask & column.notna()
+
+        if rule.type == "allowed":
+            return column.notna() & ~column.isin(params["values"])
+
+        if rule.type == "regex":
+            matched = column.astype("string").str.fullmatch(params["pattern"])
+            return column.notna() & ~matched.fillna(False).astype(bool)
+
+        if rule.type == "references":
+            allowed = params.get("values", self.reference_values.get(rule.name))
+            return column.notna() & ~column.isin(allowed)
+
+        raise ValueError(f"Unsupported rule type: {rule.type}")
+
+    def _unique_failures(
+        self, keys: List[Tuple[Rule, np.ndarray]], eligible: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """Per ``unique`` rule, rows whose key is already taken.
+
+        Rows are accepted greedily in frame order: a row claims its keys only
+        if it passes every other rule and none of its keys was accepted
+        before, so a row rejected by one ``unique`` rule never blocks a later
+        row under another.
+        """
+        failures = {rule.name: self._seen_keys[rule.name].contains(hashes) for rule, hashes in keys}
+        undecided = eligible & ~np.logical_or.reduce(list(failures.values()))
+        while undecided.any():
+            # The first undecided holder of all its keys is accepted; rows
+            # sharing a key with it are rejected. At least one row settles per pass.
+            first = undecided.copy()
+            for _, hashes in keys:
+                first[undecided] &= ~pd.Series(hashes[undecided]).duplicated().to_numpy()
+            rejected = np.zeros_like(undecided)
+            for rule, hashes in keys:
+                clash = undecided & ~first & np.isin(hashes, hashes[first])
+                failures[rule.name] |= clash
+                rejected |= clash
+            undecided &= ~first & ~rejected
+        return failures
+
+    def validate(self, df: pd.DataFrame) -> ValidationResult:
+        """Split a frame into valid and quarantined rows."""
+        failed = pd.Series(False, index=df.index)
+        labels = pd.Series("", index=df.index, dtype=object)
+        counts = {}
+
+        def record(rule: Rule, mask: pd.Series) -> None:
+            nonlocal failed
+            counts[rule.name] = int(mask.sum())
+            if counts[rule.name]:
+                failed |= mask
+                labels[mask] += rule.name + ";"
+
+        for rule in self.rules:
+            if rule.type == "null_rate":
+                nulls = int(df[rule.columns[0]].isna().sum())
+                self.nulls[rule.name] += nulls
+                counts[rule.name] = nulls
+            elif rule.type != "unique":
+                record(rule, self._failures(rule, df))
+
+        # Unique keys are judged only among rows that passed every other rule
+        keys = [(rule, hash_keys(df, rule.columns)) for rule in self.rules if rule.type == "unique"]
+        if keys:
+            duplicates = self._unique_failures(keys, ~failed.to_numpy())
+            for rule, _ in keys:
+                record(rule, pd.Series(duplicates[rule.name], index=df.index))
+
+        accepted = ~failed.to_numpy()
+        for rule, hashes in keys:
+            self._seen_keys[rule.name].add(hashes[accepted])
+
+        quarantine = df[failed].assign(**{FAILED_RULES_COLUMN: labels[failed].str.rstrip(";")})
+        self.rows += len(df)
+        self.quarantined += len(quarantine)
+        for name, count in counts.items():
+            self.totals[name] += count
+
+        if self._quarantine_writer is not None and len(quarantine):
+            self._quarantine_writer.write(quarantine.astype("string"))
+
+        return ValidationResult(valid=df[~failed], quarantine=quarantine, counts=counts)
+
+    def validate_chunks(self, chunks: Iterable[pd.DataFrame]) -> Iterator[ValidationResult]:
+        """Validate a stream of chunks, keeping cross-chunk state."""
+        try:
+            for chunk in chunks:
+                yield self.validate(chunk)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Finalize the quarantine file, if any rows were quarantined."""
+        if self._quarantine_writer is not None:
+            self._quarantine_writer.close()
+
+    def summary(self) -> Dict[str, Any]:
+        """Per-rule totals across everything validated so far.
+
+        ``null_rate`` rules are frame-level: they never quarantine rows and
+        are reported as violations once their running rate exceeds
+        ``max_rate``.
+        """
+        violations = []
+        for rule in self.rules:
+            if rule.type != "null_rate" or not self.rows:
+                continue
+            rate = self.nulls[rule.name] / self.rows
+            if rate > rule.params.get("max_rate", 0.0):
+                violations.append(rule.name)
+
+        return {
+            "rows": self.rows,
+            "quarantined": self.quarantined,
+            "failures": dict(self.totals),
+            "null_rate_violations": violations,
+        }
@@ -1,8 +1,9 @@
 # Standard library
 import contextlib
 import logging
+import os
 from pathlib import Path
-from typing import Dict, Iterator, List, Type
+from typing import Dict, Iterator, List, Optional, Type
 
 # Third-party
 import pandas as pd
@@ -10,8 +11,17 @@ import yaml
 from sqlalchemy import URL, create_engine, text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import DeclarativeMeta, Session, sessionmaker
+from sqlalchemy.schema import CreateIndex, CreateTable, DropIndex
 
 # Project modules
+from src.data.sampling import cached_sample, reservoir_sample, stratified_sample
+from src.data.storage import Filters, iter_parquet
+from src.database.partitioning import (
+    PartitionSpec,
+    partition_ddl,
+    partition_index_ddl,
+    resolve_spec,
+)
 from src.logging.logging import AppLogger
 
 
@@ -23,7 +33,12 @@ class DatabaseManager:
     - Transactional session management
     - ORM integration
     - Bulk data operations
+    - Streaming loads from Parquet datasets
+    - Reproducible, cacheable table sampling
+    - Declarative table partitioning
+    - Deferred index builds for bulk loads
     - Connection pooling
+    - Fork- and multiprocessing-safe engines
     - Configurable logging
 
     Usage:
@@ -31,6 +46,13 @@ class DatabaseManager:
     >>> db = DatabaseManager.from_yaml(Path("config/config.yaml"), logger)
     >>> with db.session_scope() as session:
     ...     session.query(User).all()
+
+    The engine belongs to the process that created it. A forked child
+    discards the inherited pool on first use and builds its own, and
+    pickling ships only config and logger, so one manager can be passed to
+    ``ProcessPoolExecutor``/joblib workers:
+    >>> with ProcessPoolExecutor() as pool:
+    ...     pool.map(load_partition, [db] * len(paths), paths)
     """
 
     # --------------------------
@@ -41,6 +63,19 @@ class DatabaseManager:
         self.config = config
         self.logger = logger
         self._engine = None
+        self._SessionLocal = None
+        self._pid = os.getpid()
+
+    def __getstate__(self) -> Dict:
+        """Pickle as config only; live engines and sessions stay behind."""
+        state = self.__dict__.copy()
+        state["_engine"] = None
+        state["_SessionLocal"] = None
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._pid = os.getpid()
 
     @classmethod
     def from_yaml(cls, config_path: Path, logger: AppLogger) -> "DatabaseManager":
@@ -70,11 +105,26 @@ class DatabaseManager:
 
     @property
     def engine(self):
-        """Lazy-loaded SQLAlchemy engine instance."""
+        """Lazy-loaded SQLAlchemy engine instance, recreated after a fork."""
+        if self._engine is not None and self._pid != os.getpid():
+            self._discard_inherited_engine()
         if self._engine is None:
             self._engine = self._create_engine()
+            self._pid = os.getpid()
         return self._engine
 
+    def _discard_inherited_engine(self) -> None:
+        """Drop a pool inherited from the parent process without closing it.
+
+        The pooled sockets are shared with the parent, so closing them here
+        would break the parent's connections; ``close=False`` just forgets
+        them in this process.
+        """
+        self._engine.dispose(close=False)
+        self._engine = None
+        self._SessionLocal = None
+        self.logger.info(f"Discarded engine inherited from parent process {self._pid}")
+
     def _create_engine(self):
         """Construct and validate SQLAlchemy engine with connection pooling."""
         db_config = self.config.setdefault("database", self._default_db_config())
@@ -145,8 +195,8 @@ class DatabaseManager:
     @property
     def SessionLocal(self):
         """Database session factory."""
-        if not hasattr(self, "_SessionLocal"):
-            engine = self.engine  
+        engine = self.engine
+        if self._SessionLocal is None:
             self._SessionLocal = sessionmaker(
                 autocommit=False,
                 autoflush=False,
@@ -177,20 +227,133 @@ class DatabaseManager:
     # Database Operations
     # --------------------------
 
-    def create_tables(self, models: List[Type[DeclarativeMeta]]) -> None:
-        """Create database tables from SQLAlchemy models."""
+    def create_tables(
+        self, models: List[Type[DeclarativeMeta]], defer_indexes: bool = False
+    ) -> None:
+        """Create database tables from SQLAlchemy models.
+
+        Models with a partition spec (``__partitioning__`` or the config
+        ``partitioning`` section) are created as partitioned tables together
+        with their initial partitions.
+
+        Args:
+            models: ORM models to create
+            defer_indexes: Skip index creation so a first bulk load runs
+                against bare heaps; call ``rebuild_indexes`` afterwards
+        """
         try:
             self.logger.info(f"Creating tables for {len(models)} models")
-            
+
             for model in models:
-                if hasattr(model, "__table__"):
-                    model.__table__.create(bind=self.engine, checkfirst=True)
-            
+                if not hasattr(model, "__table__"):
+                    continue
+                table = model.__table__
+                spec = self._partition_spec(model)
+
+                with self.engine.begin() as conn:
+                    if defer_indexes:
+                        conn.execute(CreateTable(table, if_not_exists=True))
+                    else:
+                        table.create(bind=conn, checkfirst=True)
+                    if spec is not None:
+                        self._create_partitions(conn, table.name, spec)
+
             self.logger.info(f"Successfully created {len(models)} tables")
         except SQLAlchemyError as e:
             self.logger.exception("Table creation failed")
             raise
 
+    def create_future_partitions(self, models: List[Type[DeclarativeMeta]]) -> None:
+        """Create any missing partitions up to each model's premake horizon.
+
+        Safe to run repeatedly (e.g. from a daily job); existing partitions
+        are left untouched.
+        """
+        try:
+            for model in models:
+                spec = self._partition_spec(model)
+                if spec is None:
+                    continue
+                with self.engine.begin() as conn:
+                    self._create_partitions(conn, model.__tablename__, spec)
+        except SQLAlchemyError as e:
+            self.logger.exception("Partition maintenance failed")
+            raise
+
+    def drop_indexes(self, model: Type[DeclarativeMeta]) -> None:
+        """Drop all declared indexes on a model's table ahead of a bulk load."""
+        indexes = model.__table__.indexes
+        try:
+            with self.engine.begin() as conn:
+                for index in indexes:
+                    conn.execute(DropIndex(index, if_exists=True))
+            self.logger.info(
+                f"Dropped {len(indexes)} indexes on {model.__tablename__}"
+            )
+        except SQLAlchemyError as e:
+            self.logger.exception(f"Failed to drop indexes on {model.__tablename__}")
+            raise
+
+    def rebuild_indexes(
+        self, model: Type[DeclarativeMeta], concurrently: bool = True
+    ) -> None:
+        """(Re)create all declared indexes on a model's table.
+
+        On PostgreSQL indexes are built with ``CREATE INDEX CONCURRENTLY`` so
+        readers and writers are not blocked. Partitioned tables get a
+        concurrent build per partition, after which the parent index only
+        attaches the existing partition indexes.
+
+        Args:
+            model: ORM model whose indexes to build
+            concurrently: Use concurrent builds where the dialect supports it
+        """
+        table = model.__table__
+        if not concurrently or self.engine.dialect.name != "postgresql":
+            with self.engine.begin() as conn:
+                for index in table.indexes:
+                    conn.execute(CreateIndex(index, if_not_exists=True))
+            self.logger.info(f"Rebuilt indexes on {table.name}")
+            return
+
+        try:
+            # CONCURRENTLY cannot run inside a transaction block
+            with self.engine.connect().execution_options(
+                isolation_level="AUTOCOMMIT"
+            ) as conn:
+                partitions = self._list_partitions(conn, table.name)
+                for index in table.indexes:
+                    if partitions:
+                        for partition in partitions:
+                            ddl = partition_index_ddl(index, partition)
+                            if ddl is not None:
+                                conn.execute(text(ddl))
+                        conn.execute(CreateIndex(index, if_not_exists=True))
+                    else:
+                        self._create_index_concurrently(conn, index)
+            self.logger.info(f"Rebuilt indexes concurrently on {table.name}")
+        except SQLAlchemyError as e:
+            self.logger.exception(f"Failed to rebuild indexes on {table.name}")
+            raise
+
+    @contextlib.contextmanager
+    def deferred_indexes(
+        self, models: List[Type[DeclarativeMeta]], concurrently: bool = True
+    ) -> Iterator[None]:
+        """Drop indexes for the duration of a bulk load and rebuild afterwards.
+
+        Usage:
+        >>> with db.deferred_indexes([Event]):
+        ...     db.insert_dataframe(df, Event)
+        """
+        for model in models:
+            self.drop_indexes(model)
+        try:
+            yield
+        finally:
+            for model in models:
+                self.rebuild_indexes(model, concurrently=concurrently)
+
     def insert_dataframe(self, df: pd.DataFrame, model: Type[DeclarativeMeta]) -> None:
         """Bulk insert DataFrame records into the database with validation."""
         records = df.to_dict(orient="records")
@@ -207,9 +370,265 @@ class DatabaseManager:
                 self.logger.exception(f"Failed to insert DataFrame into {model.__tablename__}: {e}")
                 raise
 
+    def insert_parquet(
+        self,
+        path: Path,
+        model: Type[DeclarativeMeta],
+        columns: Optional[List[str]] = None,
+        filters: Filters = None,
+        batch_size: int = 100_000,
+    ) -> int:
+        """Stream a Parquet dataset into a table in bounded-size batches.
+
+        Args:
+            path: Parquet file or hive-partitioned dataset directory
+            model: Target ORM model
+            columns: Columns to load (defaults to all)
+            filters: DNF filters pushed down to the Parquet scanner
+            batch_size: Maximum rows per insert transaction
+
+        Returns:
+            Total number of rows inserted
+        """
+        total = 0
+        for chunk in iter_parquet(path, columns=columns, filters=filters, batch_size=batch_size):
+            self.insert_dataframe(chunk, model)
+            total += len(chunk)
+        self.logger.info(f"Loaded {total} rows from {path} into {model.__tablename__}")
+        return total
+
+    def fetch_column_values(self, table_name: str, column: str) -> pd.Series:
+        """Fetch the distinct values of one column, e.g. for key lookups."""
+        query = text(f"SELECT DISTINCT {self._quote(column)} FROM {self._quote(table_name)}")
+        try:
+            with self.engine.connect() as conn:
+                return pd.read_sql(query, conn)[column]
+        except SQLAlchemyError as e:
+            self.logger.exception(f"Failed to fetch {column} from {table_name}")
+            raise
+
+    def iter_table_columns(
+        self,
+        table_name: str,
+        columns: Optional[List[str]] = None,
+        chunksize: int = 500_000,
+    ) -> Iterator[pd.DataFrame]:
+        """Stream selected columns of a table in chunks using a server-side cursor."""
+        query = text(f"SELECT {self._select_clause(columns)} FROM {self._quote(table_name)}")
+        try:
+            with self.engine.connect().execution_options(stream_results=True) as conn:
+                yield from pd.read_sql(query, conn, chunksize=chunksize)
+        except SQLAlchemyError as e:
+            self.logger.exception(f"Failed to stream {table_name}")
+            raise
+
+    # --------------------------
+    # Sampling
+    # --------------------------
+
+    def tablesample(
+        self,
+        table_name: str,
+        percent: float,
+        method: str = "system",
+        seed: int = 0,
+        columns: Optional[List[str]] = None,
+        cache_dir: Optional[Path] = None,
+        version: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Sample a table server-side with ``TABLESAMPLE ... REPEATABLE``.
+
+        ``SYSTEM`` picks whole pages and is the fastest; ``BERNOULLI`` picks
+        individual rows for a less clustered sample at the cost of a scan.
+
+        Args:
+            table_name: Table to sample
+            percent: Percentage of the table to return (0-100)
+            method: ``system`` or ``bernoulli``
+            seed: Seed for ``REPEATABLE``; same seed and data give the same rows
+            columns: Columns to fetch (defaults to all)
+            cache_dir: Cache the sample as Feather, keyed by its parameters
+            version: Token identifying the table's contents (e.g. a load ID or
+                ``max(updated_at)``). The cache cannot see table changes, so
+                without it a cached sample survives reloads of the table.
+        """
+        method = method.upper()
+        if method not in {"SYSTEM", "BERNOULLI"}:
+            raise ValueError(
+                f"Invalid TABLESAMPLE method '{method}'. Valid options: SYSTEM, BERNOULLI"
+            )
+        if self.engine.dialect.name != "postgresql":
+            raise ValueError("TABLESAMPLE requires PostgreSQL; use sample_reservoir instead")
+
+        query = text(
+            f"SELECT {self._select_clause(columns)} FROM {self._quote(table_name)} "
+            f"TABLESAMPLE {method} (:percent) REPEATABLE (:seed)"
+        )
+
+        def build() -> pd.DataFrame:
+            with self.engine.connect() as conn:
+                return pd.read_sql(query, conn, params={"percent": percent, "seed": seed})
+
+        params = self._sample_params(
+            "tablesample", table_name, columns, seed, version, percent=percent, method=method
+        )
+        return cached_sample(cache_dir, params, build)
+
+    def sample_reservoir(
+        self,
+        table_name: str,
+        n: int,
+        columns: Optional[List[str]] = None,
+        seed: int = 0,
+        chunksize: int = 100_000,
+        cache_dir: Optional[Path] = None,
+        version: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Uniformly sample ``n`` rows in one streamed pass, without ``ORDER BY random()``.
+
+        Works on any backend. Results are reproducible for a given seed as
+        long as the table's scan order is unchanged. Cached samples are only
+        rebuilt when ``version`` changes (see ``tablesample``).
+        """
+        def build() -> pd.DataFrame:
+            return reservoir_sample(self.iter_table_columns(table_name, columns, chunksize), n, seed)
+
+        params = self._sample_params("reservoir", table_name, columns, seed, version, n=n)
+        return cached_sample(cache_dir, params, build)
+
+    def sample_stratified(
+        self,
+        table_name: str,
+        by: str,
+        n: Optional[int] = None,
+        fraction: Optional[float] = None,
+        columns: Optional[List[str]] = None,
+        seed: int = 0,
+        chunksize: int = 100_000,
+        cache_dir: Optional[Path] = None,
+        version: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Sample every value of ``by`` in one streamed pass.
+
+        Args:
+            table_name: Table to sample
+            by: Stratum column
+            n: Rows per stratum
+            fraction: Proportion of each stratum instead of a fixed size
+            columns: Columns to fetch (must include ``by``; defaults to all)
+            seed: Random seed
+            chunksize: Rows fetched per round trip
+            cache_dir: Cache the sample as Feather, keyed by its parameters
+            version: Token identifying the table's contents; cached samples
+                are reused until it changes
+        """
+        def build() -> pd.DataFrame:
+            chunks = self.iter_table_columns(table_name, columns, chunksize)
+            return stratified_sample(chunks, by, n=n, fraction=fraction, seed=seed)
+
+        params = self._sample_params(
+            "stratified", table_name, columns, seed, version, by=by, n=n, fraction=fraction
+        )
+        return cached_sample(cache_dir, params, build)
+
     def dispose(self) -> None:
         """Clean up engine resources and connections."""
         if self._engine:
-            self._engine.dispose()
+            # A forked child must not close connections owned by its parent
+            self._engine.dispose(close=self._pid == os.getpid())
             self._engine = None  # Reset to enforce re-creation
-            self.logger.info("Database engine resources released")
\ No newline at end of file
+            self._SessionLocal = None
+            self.logger.info("Database engine resources released")
+
+    # --------------------------
+    # Partitioning Helpers
+    # --------------------------
+
+    def _partition_spec(
+        self, model: Type[DeclarativeMeta]
+    ) -> Optional[PartitionSpec]:
+        """Resolve a model's partition spec and apply it to its table."""
+        table = model.__table__
+        spec = resolve_spec(table, model, self.config)
+        if spec is None:
+            return None
+        if self.engine.dialect.name != "postgresql":
+            self.logger.warning(
+                f"Partitioning not supported on {self.engine.dialect.name}; "
+                f"creating {table.name} as a regular table"
+            )
+            return None
+        if not table.dialect_kwargs.get("postgresql_partition_by"):
+            table.dialect_kwargs["postgresql_partition_by"] = spec.partition_by
+        return spec
+
+    def _create_partitions(self, conn, table_name: str, spec: PartitionSpec) -> None:
+        """Create missing partitions for a partitioned table."""
+        statements = partition_ddl(table_name, spec)
+        for _, ddl in statements:
+            conn.execute(text(ddl))
+        self.logger.info(
+            f"Ensured {len(statements)} partitions exist for {table_name}"
+        )
+
+    @staticmethod
+    def _list_partitions(conn, table_name: str) -> List[str]:
+        """Return the names of the direct partitions of a table."""
+        result = conn.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE parent.relname = :name"
+            ),
+            {"name": table_name},
+        )
+        return [row[0] for row in result]
+
+    @staticmethod
+    def _create_index_concurrently(conn, index) -> None:
+        """Emit ``CREATE INDEX CONCURRENTLY`` for a model index.
+
+        The index's ``postgresql_concurrently`` option is switched on only for
+        the duration of the statement and then restored.
+        """
+        previous = index.dialect_kwargs.get("postgresql_concurrently", False)
+        index.dialect_kwargs["postgresql_concurrently"] = True
+        try:
+            conn.execute(CreateIndex(index, if_not_exists=True))
+        finally:
+            index.dialect_kwargs["postgresql_concurrently"] = previous
+
+    # --------------------------
+    # Query Helpers
+    # --------------------------
+
+    def _quote(self, identifier: str) -> str:
+        """Quote an identifier for the engine's dialect."""
+        return self.engine.dialect.identifier_preparer.quote(identifier)
+
+    def _select_clause(self, columns: Optional[List[str]]) -> str:
+        """Render a quoted column list, or ``*`` for all columns."""
+        if not columns:
+            return "*"
+        return ", ".join(self._quote(column) for column in columns)
+
+    def _sample_params(
+        self,
+        kind: str,
+        table_name: str,
+        columns: Optional[List[str]],
+        seed: int,
+        version: Optional[str],
+        **extra,
+    ) -> Dict:
+        """Describe a sample for cache keying (password is masked in the URL)."""
+        return {
+            "kind": kind,
+            "database": self.engine.url.render_as_string(hide_password=True),
+            "table": table_name,
+            "columns": columns,
+            "seed": seed,
+            "version": version,
+            **extra,
+        }
@@ -0,0 +1,237 @@
+# Standard library
+import hashlib
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+# Third-party
+from sqlalchemy import Index, Table
+
+
+RANGE_INTERVALS = {"day", "month", "year"}
+# PostgreSQL truncates identifiers beyond this many bytes
+MAX_IDENTIFIER_LENGTH = 63
+
+
+@dataclass
+class PartitionSpec:
+    """Declarative partitioning layout for a single table.
+
+    Declared on a model as ``__partitioning__`` or in the ``partitioning``
+    section of the database config, keyed by table name:
+
+    >>> class Event(Base):
+    ...     __tablename__ = "events"
+    ...     __partitioning__ = {"strategy": "range", "column": "event_date",
+    ...                         "interval": "month", "premake": 3}
+
+    PostgreSQL requires every primary key and unique index on a
+    partitioned table to include the partition column, so e.g. an ``id``
+    primary key must become ``(id, event_date)``.
+
+    Attributes:
+        column: Partition key column
+        strategy: ``range`` or ``list``
+        interval: Range partition width (``day``, ``month`` or ``year``)
+        premake: Number of future range partitions to keep ahead of today
+        start: Earliest date to create range partitions for, so historical
+            rows get their own partitions (defaults to the current period)
+        values: List partitions as ``{suffix: [values, ...]}``
+        default: Whether to create a DEFAULT partition for unmatched rows
+    """
+
+    column: str
+    strategy: str = "range"
+    interval: str = "month"
+    premake: int = 3
+    start: Optional[date] = None
+    values: Dict[str, List[Any]] = field(default_factory=dict)
+    default: bool = False
+
+    def __post_init__(self) -> None:
+        self.strategy = self.strategy.lower()
+        if self.strategy not in {"range", "list"}:
+            raise ValueError(f"Unsupported partition strategy: {self.strategy}")
+        if self.strategy == "range" and self.interval not in RANGE_INTERVALS:
+            raise ValueError(
+                f"Invalid partition interval '{self.interval}'. "
+                f"Valid options: {', '.join(sorted(RANGE_INTERVALS))}"
+            )
+        if isinstance(self.start, str):
+            self.start = date.fromisoformat(self.start)
+        elif isinstance(self.start, datetime):
+            self.start = self.start.date()
+
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "PartitionSpec":
+        """Build a spec from a model attribute or config mapping."""
+        if "column" not in config:
+            raise ValueError("Partition config missing 'column' key")
+        return cls(**config)
+
+    @property
+    def partition_by(self) -> str:
+        """Value for the ``postgresql_partition_by`` table option."""
+        return f"{self.strategy.upper()} ({self.column})"
+
+
+# --------------------------
+# Range Bounds
+# --------------------------
+
+
+def period_start(day: date, interval: str) -> date:
+    """Truncate a date to the start of its partition period."""
+    if interval == "day":
+        return day
+    if interval == "month":
+        return day.replace(day=1)
+    return day.replace(month=1, day=1)
+
+
+def next_period(start: date, interval: str) -> date:
+    """Return the start of the period following ``start``."""
+    if interval == "day":
+        return start + timedelta(days=1)
+    if interval == "month":
+        if start.month == 12:
+            return start.replace(year=start.year + 1, month=1)
+        return start.replace(month=start.month + 1)
+    return start.replace(year=start.year + 1)
+
+
+def range_bounds(
+    interval: str,
+    periods: int,
+    today: Optional[date] = None,
+    start: Optional[date] = None,
+) -> List[Tuple[date, date]]:
+    """List ``[lower, upper)`` bounds from ``start`` through the future periods.
+
+    Args:
+        interval: Partition width (``day``, ``month`` or ``year``)
+        periods: Number of periods after the current one to include
+        today: Reference date (defaults to today)
+        start: Earliest date to cover (defaults to the current period)
+    """
+    current = period_start(today or date.today(), interval)
+    end = current
+    for _ in range(periods + 1):
+        end = next_period(end, interval)
+
+    lower = min(period_start(start, interval), current) if start else current
+    bounds = []
+    while lower < end:
+        upper = next_period(lower, interval)
+        bounds.append((lower, upper))
+        lower = upper
+    return bounds
+
+
+def partition_name(table_name: str, lower: date, interval: str) -> str:
+    """Name a range partition after the period it covers."""
+    fmt = {"day": "%Y%m%d", "month": "%Y%m", "year": "%Y"}[interval]
+    return f"{table_name}_p{lower.strftime(fmt)}"
+
+
+# --------------------------
+# DDL Builders
+# --------------------------
+
+
+def _literal(value: Any) -> str:
+    """Render a partition bound as a SQL literal."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    escaped = str(value).replace("'", "''")
+    return f"'{escaped}'"
+
+
+def partition_ddl(
+    table_name: str, spec: PartitionSpec, today: Optional[date] = None
+) -> List[Tuple[str, str]]:
+    """Build ``CREATE TABLE ... PARTITION OF`` statements for a spec.
+
+    Returns:
+        List of ``(partition_name, ddl)`` pairs, in creation order.
+    """
+    statements = []
+    if spec.strategy == "range":
+        for lower, upper in range_bounds(spec.interval, spec.premake, today, spec.start):
+            name = partition_name(table_name, lower, spec.interval)
+            statements.append((
+                name,
+                f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{table_name}" '
+                f"FOR VALUES FROM ({_literal(lower.isoformat())}) "
+                f"TO ({_literal(upper.isoformat())})",
+            ))
+    else:
+        for suffix, values in spec.values.items():
+            name = f"{table_name}_{suffix}"
+            rendered = ", ".join(_literal(v) for v in values)
+            statements.append((
+                name,
+                f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{table_name}" '
+                f"FOR VALUES IN ({rendered})",
+            ))
+
+    if spec.default:
+        name = f"{table_name}_default"
+        statements.append((
+            name,
+            f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{table_name}" DEFAULT',
+        ))
+    return statements
+
+
+def index_columns(index: Index) -> Optional[List[str]]:
+    """Column names of a plain column index, or None for expression indexes."""
+    columns = list(index.columns)
+    if not columns or len(columns) != len(index.expressions):
+        return None
+    return [column.name for column in columns]
+
+
+def partition_index_name(index_name: str, partition: str) -> str:
+    """Name a partition's copy of an index, unique and within the identifier limit.
+
+    A readable prefix of the parent index name is kept and a hash of the
+    index/partition pair is appended, so names never collide after
+    PostgreSQL truncation.
+    """
+    digest = hashlib.sha1(f"{index_name}:{partition}".encode()).hexdigest()[:12]
+    prefix = index_name[: MAX_IDENTIFIER_LENGTH - len(digest) - 1]
+    return f"{prefix}_{digest}"
+
+
+def partition_index_ddl(index: Index, partition: str) -> Optional[str]:
+    """Build a concurrent index build for one partition of a partitioned table.
+
+    Postgres cannot build indexes concurrently on a partitioned parent, but
+    it attaches matching partition indexes when the parent index is created
+    afterwards, so the heavy work can still run without blocking writes.
+    """
+    columns = index_columns(index)
+    if columns is None:
+        return None
+    unique = "UNIQUE " if index.unique else ""
+    rendered = ", ".join(f'"{column}"' for column in columns)
+    name = partition_index_name(index.name, partition)
+    return (
+        f'CREATE {unique}INDEX CONCURRENTLY IF NOT EXISTS "{name}" '
+        f'ON "{partition}" ({rendered})'
+    )
+
+
+def resolve_spec(table: Table, model: Any, config: Dict) -> Optional[PartitionSpec]:
+    """Find the partition spec for a model, preferring the model declaration."""
+    declared = getattr(model, "__partitioning__", None)
+    if declared is None:
+        declared = config.get("partitioning", {}).get(table.name)
+    if declared is None:
+        return None
+    if isinstance(declared, PartitionSpec):
+        return declared
+    return PartitionSpec.from_dict(declared)
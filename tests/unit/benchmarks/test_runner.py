@@ -0,0 +1,27 @@
+from benchmarks.generators import generate_frame
+from benchmarks.runner import find_regressions, load_baseline, run_case, save_baseline
+
+
+def test_generate_frame_respects_ratios():
+    df = generate_frame(rows=1_000, columns=10, string_ratio=0.3, na_ratio=0.5, seed=1)
+
+    assert df.shape == (1_000, 10)
+    assert sum(dtype.kind != "f" for dtype in df.dtypes) == 3
+    assert 0.4 < df.isna().mean().mean() < 0.6
+
+
+def test_baseline_round_trip_and_regression(tmp_path):
+    result = run_case("noop", lambda: None, items=10, repeat=3)
+    path = tmp_path / "baseline.json"
+    save_baseline([result], path)
+
+    baseline = load_baseline(path)
+    assert find_regressions([result], baseline, threshold=0.2) == []
+
+    baseline["noop"]["p50_s"] = result.p50_s / 2
+    [regression] = find_regressions([result], baseline, threshold=0.2)
+    assert regression.startswith("noop:")
+
+
+def test_missing_baseline_is_empty(tmp_path):
+    assert load_baseline(tmp_path / "missing.json") == {}
@@ -0,0 +1,71 @@
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine, text
+
+from src.data.dedup import Deduplicator, HashSet
+from src.database.manager import DatabaseManager
+
+
+def test_hash_set_spills_to_disk(tmp_path):
+    seen = HashSet(spill_dir=tmp_path, spill_threshold=3)
+
+    seen.add(np.array([5, 1, 3], dtype=np.uint64))
+    seen.add(np.array([9], dtype=np.uint64))
+
+    assert len(seen) == 4
+    assert [p.name for p in tmp_path.iterdir()] == ["hashes-00000.npy"]
+    assert seen.contains(np.array([1, 2, 9, 10], dtype=np.uint64)).tolist() == [
+        True,
+        False,
+        True,
+        False,
+    ]
+
+    seen.close()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_hash_set_counts_each_key_once_across_runs(tmp_path):
+    seen = HashSet(spill_dir=tmp_path, spill_threshold=40)
+    rng = np.random.default_rng(0)
+    keys = rng.integers(0, 100, size=(20, 10)).astype(np.uint64)
+
+    stored = set()
+    for chunk in keys:
+        assert seen.add(chunk).tolist() == [int(k) in stored for k in chunk]
+        stored.update(int(k) for k in chunk)
+
+    assert len(seen) == len(np.unique(keys))
+    assert seen.add(np.unique(keys)).all()
+    assert len(seen) == len(np.unique(keys))
+    assert not seen.contains(np.arange(100, 110, dtype=np.uint64)).any()
+    seen.close()
+
+
+def test_drop_duplicates_within_and_across_chunks():
+    dedup = Deduplicator(["order_id", "line"])
+    chunks = [
+        pd.DataFrame({"order_id": [1, 1, 2], "line": [1, 1, 1], "qty": [3, 4, 5]}),
+        pd.DataFrame({"order_id": [2, 2], "line": [1, 2], "qty": [6, 7]}),
+    ]
+
+    unique = pd.concat(dedup.iter_unique(chunks))
+
+    assert unique["qty"].tolist() == [3, 5, 7]
+    assert (dedup.rows, dedup.dropped) == (5, 2)
+
+
+def test_seed_from_database_skips_stored_keys():
+    db = DatabaseManager(config={}, logger=Mock())
+    db._engine = create_engine("sqlite://")
+    with db.engine.begin() as conn:
+        conn.execute(text("CREATE TABLE orders (order_id INTEGER, qty INTEGER)"))
+        conn.execute(text("INSERT INTO orders VALUES (1, 1), (2, 1)"))
+
+    dedup = Deduplicator(["order_id"])
+    assert dedup.seed_from_database(db, "orders", dtypes={"order_id": "int64"}) == 2
+
+    df = pd.DataFrame({"order_id": [1, 3], "qty": [9, 9]})
+    assert dedup.drop_duplicates(df)["order_id"].tolist() == [3]
@@ -0,0 +1,84 @@
+import pytest
+from openpyxl import Workbook
+
+from src.data.excel import clean_excel_to_parquet, iter_excel_chunks
+from src.data.storage import read_parquet
+
+
+@pytest.fixture
+def workbook_path(tmp_path):
+    workbook = Workbook()
+    orders = workbook.active
+    orders.title = "Orders"
+    orders.append(["orderId", "Customer name", None])
+    for i in range(5):
+        orders.append([i, f" customer {i} ", "x"])
+    orders.append([None, None, None])
+
+    returns = workbook.create_sheet("Returns")
+    returns.append(["orderId"])
+    returns.append([3])
+
+    path = tmp_path / "feed.xlsx"
+    workbook.save(path)
+    return path
+
+
+def test_iter_excel_chunks_sanitizes_and_bounds_chunks(workbook_path):
+    chunks = list(iter_excel_chunks(workbook_path, "Orders", chunksize=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert list(chunks[0].columns) == ["order_id", "customer_name", "column_2"]
+
+
+def test_clean_excel_to_parquet_processes_each_sheet(workbook_path, tmp_path):
+    outputs = clean_excel_to_parquet(
+        workbook_path, tmp_path / "cleaned", {}, chunksize=2, max_workers=2
+    )
+
+    assert set(outputs) == {"Orders", "Returns"}
+    orders = read_parquet(outputs["Orders"])
+    assert orders["customer_name"].tolist()[:2] == ["customer 0", "customer 1"]
+    assert read_parquet(outputs["Returns"])["order_id"].tolist() == [3]
+
+
+def test_clean_excel_to_parquet_fixes_schema_across_chunks(tmp_path):
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "Feed"
+    sheet.append(["qty", "note"])
+    for i in range(4):
+        sheet.append([i, None])
+    sheet.append([0.5, "late"])
+    sheet.append([7, "early"])
+    path = tmp_path / "mixed.xlsx"
+    workbook.save(path)
+    output_dir = tmp_path / "cleaned"
+
+    outputs = clean_excel_to_parquet(path, output_dir, {"drop_na": False}, chunksize=4)
+
+    df = read_parquet(outputs["Feed"])
+    assert df["qty"].tolist() == [0.0, 1.0, 2.0, 3.0, 0.5, 7.0]
+    assert df["note"].tolist()[4:] == ["late", "early"]
+
+    # A rerun that produces fewer chunks must not leave stale parts behind
+    outputs = clean_excel_to_parquet(path, output_dir, {"drop_na": False}, chunksize=100)
+    assert len(read_parquet(outputs["Feed"])) == 6
+    assert [p.name for p in outputs["Feed"].iterdir()] == ["part-00000.parquet"]
+
+
+def test_clean_excel_to_parquet_separates_sheets_with_clashing_names(tmp_path):
+    workbook = Workbook()
+    workbook.active.title = "Sales Data"
+    workbook.create_sheet("Sales-Data")
+    for value, sheet in enumerate(workbook.worksheets):
+        sheet.append(["qty"])
+        sheet.append([value])
+    path = tmp_path / "clash.xlsx"
+    workbook.save(path)
+
+    outputs = clean_excel_to_parquet(path, tmp_path / "cleaned", {}, max_workers=2)
+
+    assert outputs["Sales Data"] != outputs["Sales-Data"]
+    assert read_parquet(outputs["Sales Data"])["qty"].tolist() == [0]
+    assert read_parquet(outputs["Sales-Data"])["qty"].tolist() == [1]
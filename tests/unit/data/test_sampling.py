@@ -0,0 +1,88 @@
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+
+from src.data.sampling import reservoir_sample, sample_parquet, stratified_sample
+from src.data.storage import write_parquet
+from src.database.manager import DatabaseManager
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({"id": np.arange(1_000), "group": np.repeat(["a", "b", "c", "d"], 250)})
+
+
+def chunks_of(df, size=128):
+    return (df.iloc[i:i + size] for i in range(0, len(df), size))
+
+
+def test_reservoir_sample_is_reproducible(frame):
+    first = reservoir_sample(chunks_of(frame), n=50, seed=7)
+    second = reservoir_sample(chunks_of(frame), n=50, seed=7)
+
+    assert len(first) == 50
+    assert first["id"].is_unique
+    pd.testing.assert_frame_equal(first, second)
+    assert not first.equals(reservoir_sample(chunks_of(frame), n=50, seed=8))
+
+
+def test_stratified_sample_caps_each_stratum(frame):
+    sample = stratified_sample(chunks_of(frame), "group", n=10, seed=1)
+
+    assert sample.groupby("group").size().to_dict() == {"a": 10, "b": 10, "c": 10, "d": 10}
+
+    with pytest.raises(ValueError):
+        stratified_sample(chunks_of(frame), "group")
+
+
+def test_sample_parquet_uses_cache(frame, tmp_path):
+    path = write_parquet(frame, tmp_path / "frame.parquet")
+    cache = tmp_path / "cache"
+
+    first = sample_parquet(path, n=20, columns=["id"], seed=3, batch_size=100, cache_dir=cache)
+    assert len(list(cache.iterdir())) == 1
+
+    second = sample_parquet(path, n=20, columns=["id"], seed=3, batch_size=100, cache_dir=cache)
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_sample_cache_invalidated_by_new_data(frame, tmp_path):
+    path = tmp_path / "frame"
+    cache = tmp_path / "cache"
+    write_parquet(frame, path, append=True)
+    first = sample_parquet(path, n=20, seed=3, cache_dir=cache)
+
+    write_parquet(frame.assign(id=frame["id"] + 1_000), path, append=True)
+    second = sample_parquet(path, n=20, seed=3, cache_dir=cache)
+
+    assert len(list(cache.iterdir())) == 2
+    assert not first.equals(second)
+
+
+def test_manager_sample_cache_keyed_by_version(frame, tmp_path):
+    db = DatabaseManager(config={}, logger=Mock())
+    db._engine = create_engine("sqlite://")
+    frame.to_sql("events", db.engine, index=False)
+    cache = tmp_path / "cache"
+
+    db.sample_reservoir("events", n=5, cache_dir=cache, version="load-1")
+    db.sample_reservoir("events", n=5, cache_dir=cache, version="load-1")
+    db.sample_reservoir("events", n=5, cache_dir=cache, version="load-2")
+
+    assert len(list(cache.iterdir())) == 2
+
+
+def test_manager_sampling_on_sqlite(frame):
+    db = DatabaseManager(config={}, logger=Mock())
+    db._engine = create_engine("sqlite://")
+    frame.to_sql("events", db.engine, index=False)
+
+    assert len(db.sample_reservoir("events", n=25, chunksize=100)) == 25
+    by_group = db.sample_stratified("events", "group", n=5, chunksize=100)
+    assert by_group.groupby("group").size().tolist() == [5, 5, 5, 5]
+
+    with pytest.raises(ValueError):
+        db.tablesample("events", percent=10)
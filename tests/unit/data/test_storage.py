@@ -0,0 +1,114 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from src.data import storage
+from src.data.cleaning import clean_data
+from src.data.storage import (
+    ParquetChunkWriter,
+    iter_parquet,
+    read_feather,
+    read_parquet,
+    write_feather,
+    write_parquet,
+)
+
+
+@pytest.fixture
+def sales():
+    return pd.DataFrame(
+        {
+            "region": ["eu", "eu", "us", "us"],
+            "year": [2023, 2024, 2023, 2024],
+            "amount": [1.5, 2.5, 3.5, 4.5],
+        }
+    )
+
+
+def test_partitioned_parquet_projection_and_filter(sales, tmp_path):
+    path = write_parquet(sales, tmp_path / "sales", partition_cols=["region"])
+
+    assert sorted(p.name for p in path.iterdir()) == ["_common_metadata", "region=eu", "region=us"]
+
+    df = read_parquet(path, columns=["year", "amount"], filters=[("region", "=", "us")])
+    assert list(df.columns) == ["year", "amount"]
+    assert df["amount"].tolist() == [3.5, 4.5]
+
+
+def test_iter_parquet_respects_batch_size(sales, tmp_path):
+    path = write_parquet(sales, tmp_path / "sales.parquet", compression="snappy")
+
+    chunks = list(iter_parquet(path, batch_size=3))
+
+    assert [len(chunk) for chunk in chunks] == [3, 1]
+
+
+def test_feather_round_trip_memory_mapped(sales, tmp_path):
+    path = write_feather(sales, tmp_path / "sales.feather")
+
+    df = read_feather(path, columns=["region", "amount"])
+
+    pd.testing.assert_frame_equal(df, sales[["region", "amount"]])
+
+
+def test_clean_data_writes_output(tmp_path):
+    raw = pd.DataFrame({"unitPrice": [" 1 ", "2"]})
+    output = tmp_path / "cleaned.parquet"
+
+    clean_data(raw, {"output": {"path": str(output)}})
+
+    assert read_parquet(output)["unit_price"].tolist() == ["1", "2"]
+
+
+def test_append_mode_unifies_chunk_schemas(tmp_path, monkeypatch):
+    # The recorded schema must make reading every footer unnecessary
+    monkeypatch.setattr(storage, "_unified_dataset", None)
+    path = tmp_path / "chunks"
+    write_parquet(pd.DataFrame({"qty": [1, 2], "note": [None, None]}), path, append=True)
+    write_parquet(pd.DataFrame({"qty": [0.5], "note": ["late"]}), path, append=True)
+
+    df = read_parquet(path)
+
+    assert len(list(path.glob("*.parquet"))) == 2
+    assert sorted(df["qty"].tolist()) == [0.5, 1.0, 2.0]
+    assert df["note"].dropna().tolist() == ["late"]
+    assert sum(len(chunk) for chunk in iter_parquet(path, batch_size=1)) == 3
+
+
+def test_clean_data_appends_streamed_chunks(tmp_path):
+    config = {"output": {"path": str(tmp_path / "cleaned"), "mode": "append"}}
+
+    clean_data(pd.DataFrame({"unitPrice": ["1"]}), config)
+    clean_data(pd.DataFrame({"unitPrice": ["2"]}), config)
+
+    assert sorted(read_parquet(tmp_path / "cleaned")["unit_price"]) == ["1", "2"]
+
+
+def test_chunk_writer_keeps_integers_until_a_chunk_needs_floats(tmp_path):
+    ids = tmp_path / "ids.parquet"
+    with ParquetChunkWriter(ids) as writer:
+        writer.write(pd.DataFrame({"id": [2**53 + 1, 2]}))
+        writer.write(pd.DataFrame({"id": [3.0, None]}))
+    table = pq.read_table(ids)
+    assert table.schema.field("id").type == pa.int64()
+    assert table["id"].to_pylist() == [2**53 + 1, 2, 3, None]
+
+    qty = tmp_path / "qty.parquet"
+    with ParquetChunkWriter(qty) as writer:
+        writer.write(pd.DataFrame({"qty": [1, 2]}))
+        writer.write(pd.DataFrame({"qty": [0.5]}))
+    assert read_parquet(qty)["qty"].tolist() == [1.0, 2.0, 0.5]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["ids.parquet", "qty.parquet"]
+
+
+def test_unrecorded_dataset_schemas_are_unified_on_failure(tmp_path):
+    path = tmp_path / "foreign"
+    path.mkdir()
+    pd.DataFrame({"note": [None, None]}).to_parquet(path / "a.parquet")
+    pd.DataFrame({"note": ["late"]}).to_parquet(path / "b.parquet")
+
+    assert read_parquet(path)["note"].isna().tolist() == [True, True, False]
+    chunks = list(iter_parquet(path, batch_size=1))
+    assert pd.concat(chunks)["note"].tolist()[2:] == ["late"]
+    assert len(chunks) == 3
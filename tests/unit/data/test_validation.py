@@ -0,0 +1,159 @@
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.storage import read_parquet
+from src.data.validation import Rule, Validator
+
+
+@pytest.fixture
+def config(tmp_path):
+    return {
+        "validation": {
+            "quarantine_path": str(tmp_path / "quarantine"),
+            "rules": [
+                {"name": "amount_positive", "type": "range", "column": "amount", "min": 0},
+                {"name": "order_unique", "type": "unique", "columns": ["order_id"]},
+                {"name": "known_region", "type": "allowed", "column": "region", "values": ["eu", "us"]},
+                {"name": "customer_fk", "type": "references", "column": "customer_id", "table": "customers"},
+                {"name": "email_sparse", "type": "null_rate", "column": "email", "max_rate": 0.2},
+            ],
+        }
+    }
+
+
+@pytest.fixture
+def validator(config):
+    db = Mock()
+    db.fetch_column_values.return_value = pd.Series([10, 11])
+    return Validator.from_config(config, db=db)
+
+
+def test_validate_quarantines_failing_rows(validator):
+    df = pd.DataFrame(
+        {
+            "order_id": [1, 2, 2, 3],
+            "amount": [5.0, -1.0, 3.0, np.nan],
+            "region": ["eu", "eu", "us", "apac"],
+            "customer_id": [10, 11, 12, 10],
+            "email": ["a@x", None, "c@x", "d@x"],
+        }
+    )
+
+    result = validator.validate(df)
+
+    assert result.valid["order_id"].tolist() == [1]
+    assert result.quarantine["_failed_rules"].tolist() == [
+        "amount_positive",
+        "customer_fk",
+        "known_region",
+    ]
+    assert result.counts == {
+        "amount_positive": 1,
+        "order_unique": 0,
+        "known_region": 1,
+        "customer_fk": 1,
+        "email_sparse": 1,
+    }
+
+
+def test_validate_chunks_keeps_unique_state_and_writes_quarantine(validator, tmp_path):
+    chunks = [
+        pd.DataFrame({"order_id": [1, 2], "amount": [1, 1], "region": ["eu", "us"],
+                      "customer_id": [10, 10], "email": [None, None]}),
+        pd.DataFrame({"order_id": [2, 3], "amount": [1, 1], "region": ["eu", "us"],
+                      "customer_id": [10, 10], "email": ["a", "b"]}),
+    ]
+
+    valid = [result.valid for result in validator.validate_chunks(chunks)]
+
+    assert pd.concat(valid)["order_id"].tolist() == [1, 2, 3]
+    assert read_parquet(tmp_path / "quarantine")["order_id"].tolist() == ["2"]
+    assert validator.summary() == {
+        "rows": 4,
+        "quarantined": 1,
+        "failures": {
+            "amount_positive": 0,
+            "order_unique": 1,
+            "known_region": 0,
+            "customer_fk": 0,
+            "email_sparse": 2,
+        },
+        "null_rate_violations": ["email_sparse"],
+    }
+
+
+def test_rule_rejects_unknown_type():
+    with pytest.raises(ValueError):
+        Rule.from_dict({"type": "sometimes", "column": "x"})
+
+
+def test_rejected_rows_do_not_claim_unique_keys():
+    validator = Validator.from_config({"validation": {"rules": [
+        {"name": "amount_positive", "type": "range", "column": "amount", "min": 0},
+        {"name": "unique_id", "type": "unique", "column": "id"},
+    ]}})
+
+    rejected = validator.validate(pd.DataFrame({"id": [1], "amount": [-5]}))
+    corrected = validator.validate(pd.DataFrame({"id": [1, 1], "amount": [5, 6]}))
+
+    assert rejected.quarantine["_failed_rules"].tolist() == ["amount_positive"]
+    assert corrected.valid["amount"].tolist() == [5]
+    assert corrected.quarantine["_failed_rules"].tolist() == ["unique_id"]
+
+
+@pytest.mark.parametrize("order", [["a", "b"], ["b", "a"]])
+def test_unique_rules_ignore_keys_of_rows_rejected_by_another(order):
+    validator = Validator.from_config({"validation": {"rules": [
+        {"name": f"unique_{column}", "type": "unique", "column": column} for column in order
+    ]}})
+
+    validator.validate(pd.DataFrame({"a": [1], "b": [100]}))
+    result = validator.validate(pd.DataFrame({"a": [1, 2], "b": [5, 5]}))
+
+    assert result.valid["a"].tolist() == [2]
+    assert result.quarantine["_failed_rules"].tolist() == ["unique_a"]
+
+
+def test_range_rule_quarantines_unparseable_values():
+    validator = Validator.from_config({"validation": {"rules": [
+        {"name": "qty_positive", "type": "range", "column": "qty", "min": 0},
+    ]}})
+
+    result = validator.validate(pd.DataFrame({"qty": [3, "n/a", -1, None]}, dtype=object))
+
+    assert result.valid["qty"].tolist() == [3, None]
+    assert result.counts == {"qty_positive": 2}
+
+
+def test_quarantine_accepts_column_type_changes(tmp_path):
+    validator = Validator.from_config({"validation": {
+        "quarantine_path": str(tmp_path / "quarantine"),
+        "rules": [{"name": "known_ref", "type": "allowed", "column": "ref", "values": [1]}],
+    }})
+    chunks = [pd.DataFrame({"ref": [12]}), pd.DataFrame({"ref": ["A-12"]})]
+
+    list(validator.validate_chunks(chunks))
+
+    assert read_parquet(tmp_path / "quarantine")["ref"].tolist() == ["12", "A-12"]
+
+
+def test_quarantine_runs_share_readable_output(tmp_path):
+    config = {"validation": {
+        "quarantine_path": str(tmp_path / "quarantine"),
+        "rules": [{"name": "qty_positive", "type": "range", "column": "qty", "min": 0}],
+    }}
+    chunks = [
+        pd.DataFrame({"qty": [-1], "note": [None]}),
+        pd.DataFrame({"qty": [-2], "note": ["x"]}),
+    ]
+
+    for _ in range(2):
+        list(Validator.from_config(config).validate_chunks(chunks))
+
+    quarantine = read_parquet(tmp_path / "quarantine")
+    assert len(list((tmp_path / "quarantine").iterdir())) == 2
+    assert sorted(quarantine["qty"].tolist()) == ["-1", "-1", "-2", "-2"]
+    assert quarantine["note"].dropna().tolist() == ["x", "x"]
@@ -0,0 +1,59 @@
+import os
+import pickle
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.database.manager import DatabaseManager
+
+
+@pytest.fixture
+def manager():
+    manager = DatabaseManager(config={"database": {"host": "db"}}, logger=Mock())
+    manager._engine = Mock()
+    manager._SessionLocal = Mock()
+    return manager
+
+
+def test_engine_is_recreated_after_pid_change(manager):
+    inherited = manager._engine
+    fresh = Mock()
+    child_pid = os.getpid() + 1
+
+    with patch("src.database.manager.os.getpid", return_value=child_pid), \
+            patch.object(DatabaseManager, "_create_engine", return_value=fresh):
+        assert manager.engine is fresh
+        assert manager._SessionLocal is None
+        assert manager._pid == child_pid
+
+    inherited.dispose.assert_called_once_with(close=False)
+
+
+def test_engine_is_reused_in_same_process(manager):
+    engine = manager._engine
+
+    assert manager.engine is engine
+    engine.dispose.assert_not_called()
+
+
+def test_dispose_in_child_leaves_parent_connections_open(manager):
+    engine = manager._engine
+
+    with patch("src.database.manager.os.getpid", return_value=os.getpid() + 1):
+        manager.dispose()
+
+    engine.dispose.assert_called_once_with(close=False)
+    assert manager._engine is None
+
+
+def test_pickle_ships_config_only():
+    manager = DatabaseManager(config={"database": {"host": "db"}}, logger=Mock())
+    manager.logger = None
+    manager._engine = object()
+
+    clone = pickle.loads(pickle.dumps(manager))
+
+    assert clone.config == manager.config
+    assert clone._engine is None
+    assert clone._SessionLocal is None
+    assert manager._engine is not None
@@ -0,0 +1,125 @@
+import pytest
+from datetime import date
+from unittest.mock import Mock
+from sqlalchemy import Column, Date, Index, Integer, create_engine, inspect
+from sqlalchemy.orm import declarative_base
+
+from src.database.manager import DatabaseManager
+from src.database.partitioning import (
+    PartitionSpec,
+    partition_ddl,
+    partition_index_ddl,
+    partition_index_name,
+    range_bounds,
+)
+
+
+Base = declarative_base()
+
+
+class Reading(Base):
+    __tablename__ = "readings"
+    __table_args__ = (Index("ix_readings_sensor", "sensor_id"),)
+
+    id = Column(Integer, primary_key=True)
+    sensor_id = Column(Integer)
+    taken_on = Column(Date)
+
+
+@pytest.fixture
+def sqlite_manager():
+    manager = DatabaseManager(config={}, logger=Mock())
+    manager._engine = create_engine("sqlite:///:memory:")
+    return manager
+
+
+def test_range_bounds_roll_over_year():
+    bounds = range_bounds("month", 2, today=date(2024, 11, 17))
+
+    assert bounds == [
+        (date(2024, 11, 1), date(2024, 12, 1)),
+        (date(2024, 12, 1), date(2025, 1, 1)),
+        (date(2025, 1, 1), date(2025, 2, 1)),
+    ]
+
+
+def test_partition_ddl_covers_history_from_start():
+    spec = PartitionSpec.from_dict(
+        {"column": "taken_on", "interval": "month", "premake": 1, "start": "2023-11-15"}
+    )
+
+    statements = partition_ddl("readings", spec, today=date(2024, 2, 10))
+
+    assert [name for name, _ in statements] == [
+        "readings_p202311",
+        "readings_p202312",
+        "readings_p202401",
+        "readings_p202402",
+        "readings_p202403",
+    ]
+    assert "FOR VALUES FROM ('2023-11-01') TO ('2023-12-01')" in statements[0][1]
+
+
+def test_partition_ddl_range_with_default():
+    spec = PartitionSpec(column="taken_on", interval="year", premake=1, default=True)
+
+    statements = partition_ddl("readings", spec, today=date(2024, 6, 1))
+
+    assert [name for name, _ in statements] == [
+        "readings_p2024",
+        "readings_p2025",
+        "readings_default",
+    ]
+    assert "FOR VALUES FROM ('2024-01-01') TO ('2025-01-01')" in statements[0][1]
+    assert statements[-1][1].endswith("DEFAULT")
+
+
+def test_partition_ddl_list():
+    spec = PartitionSpec.from_dict(
+        {"column": "region", "strategy": "list", "values": {"eu": ["de", "fr"]}}
+    )
+
+    [(name, ddl)] = partition_ddl("sales", spec)
+
+    assert name == "sales_eu"
+    assert "FOR VALUES IN ('de', 'fr')" in ddl
+    assert spec.partition_by == "LIST (region)"
+
+
+def test_partition_spec_rejects_unknown_interval():
+    with pytest.raises(ValueError):
+        PartitionSpec(column="taken_on", interval="week")
+
+
+def test_partition_index_ddl_is_concurrent():
+    index = next(iter(Reading.__table__.indexes))
+
+    ddl = partition_index_ddl(index, "readings_p2024")
+
+    name = partition_index_name("ix_readings_sensor", "readings_p2024")
+    assert ddl == (
+        f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{name}" '
+        'ON "readings_p2024" ("sensor_id")'
+    )
+
+
+def test_partition_index_name_fits_identifier_limit():
+    index_name = "ix_fact_customer_transactions_customer_id"
+    partitions = [f"fact_customer_transactions_p2024{m:02d}" for m in range(1, 13)]
+
+    names = [partition_index_name(index_name, p) for p in partitions]
+
+    assert all(len(name) <= 63 for name in names)
+    assert len(set(names)) == len(partitions)
+    assert all(name.startswith("ix_fact_customer_transactions") for name in names)
+
+
+def test_deferred_indexes_rebuilds_after_load(sqlite_manager):
+    sqlite_manager.create_tables([Reading], defer_indexes=True)
+    assert inspect(sqlite_manager.engine).get_indexes("readings") == []
+
+    with sqlite_manager.deferred_indexes([Reading]):
+        assert inspect(sqlite_manager.engine).get_indexes("readings") == []
+
+    names = [ix["name"] for ix in inspect(sqlite_manager.engine).get_indexes("readings")]
+    assert names == ["ix_readings_sensor"]
@@ -0,0 +1,55 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[3] / "scripts" / "cleanup.py"
+
+
+@pytest.fixture
+def cleanup():
+    spec = importlib.util.spec_from_file_location("cleanup", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def project(tmp_path):
+    files = [
+        "src/__pycache__/a.pyc",
+        "src/module.py",
+        "src/old.pyo",
+        "run.log",
+        ".venv/lib/site.pyc",
+        "data/raw/keep.log",
+        "notebooks/data/raw/drop.log",
+    ]
+    for name in files:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x" * 10)
+    return tmp_path
+
+
+def test_find_artifacts_prunes_excluded_trees(cleanup, project):
+    found = {a.path.relative_to(project).as_posix() for a in cleanup.find_artifacts(project)}
+
+    assert found == {
+        "src/__pycache__",
+        "src/old.pyo",
+        "run.log",
+        "notebooks/data/raw/drop.log",
+    }
+
+
+def test_remove_artifacts_reports_bytes(cleanup, project):
+    artifacts = cleanup.find_artifacts(project)
+
+    assert cleanup.remove_artifacts(artifacts, dry_run=True) == 40
+    assert (project / "run.log").exists()
+
+    assert cleanup.remove_artifacts(artifacts, workers=2) == 40
+    assert not (project / "src/__pycache__").exists()
+    assert (project / "src/module.py").exists()
+    assert (project / "data/raw/keep.log").exists()